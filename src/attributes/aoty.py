@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import polars as pl
+from bs4 import SoupStrainer
+
 all_tags = (
     "position",
     "album",
@@ -51,7 +54,20 @@ album_list = {
         },
         "type": "str",
     },
+    "user_score": {
+        "tag": "div",
+        "class": "scoreValue",
+        "type": "int",
+    },
+    "user_ratings": {
+        "tag": "div",
+        "class": "scoreText",
+        "match": r"[\d,]+",
+        "replace": {",": ""},
+        "type": "int",
+    },
 }
+list_score = {"user_score": album_list["user_score"]}
 album = {
     "album": {
         "tag": "div",
@@ -239,3 +255,51 @@ tracklist = {
         "type": "int",
     },
 }
+
+list_page = SoupStrainer(id="centerContent")
+album_page = SoupStrainer(id=["centerContent", "tracklist"])
+
+__links__ = {
+    k: pl.List(pl.Struct({k: pl.String, "url": pl.String}))
+    for k in ("genre", "label", "producer", "writer", "artist")
+}
+schema = {
+    "internal_id": pl.Int64,
+    "type": pl.String,
+    "page_number": pl.Int64,
+    "position": pl.Int64,
+    "album": pl.String,
+    "album_url": pl.String,
+    "user_score": pl.Int64,
+    "user_ratings": pl.Int64,
+    "cover_url": pl.String,
+    "artist": pl.String,
+    "artist_url": pl.String,
+    "critic_score": pl.Int64,
+    "critic_reviews": pl.Int64,
+    "year": pl.Int64,
+    "month": pl.String,
+    "day": pl.String,
+    "genre": __links__["genre"],
+    "labels": __links__["label"],
+    "producers": __links__["producer"],
+    "writers": __links__["writer"],
+    "tracks": pl.List(
+        pl.Struct(
+            {
+                "track_disc": pl.String,
+                "track_number": pl.Int64,
+                "track_title": pl.String,
+                "track_url": pl.String,
+                "sub_tracks": pl.List(pl.String),
+                "track_length": pl.String,
+                "featuring": __links__["artist"],
+                "track_score": pl.Int64,
+                "track_ratings": pl.Int64,
+            }
+        )
+    ),
+    "total_length": pl.Duration("us"),
+    "detail_date": pl.Datetime("us"),
+    "id": pl.String,
+}
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import polars as pl
+from bs4 import SoupStrainer
+
 all_tags = (
     "position",
     "album",
@@ -50,9 +53,9 @@ album_list = {
         "type": "str",
     },
     "year": {
-        "tag": "br",
-        "number": 1,
-        "match": r"\d{4}",
+        "tag": "td",
+        "number": 2,
+        "match": r"(?<=, )\d{4}",
         "type": "int",
     },
     "qwr": {
@@ -81,3 +84,43 @@ album = {
         "tag": "blockquote",
     },
 }
+
+genres_page = SoupStrainer(id="navGenre")
+list_page = SoupStrainer("table")
+album_page = SoupStrainer(["td", "blockquote"])
+
+schema = {
+    "type": pl.String,
+    "genre": pl.String,
+    "position": pl.Int64,
+    "album": pl.String,
+    "album_url": pl.String,
+    "cover_url": pl.String,
+    "artist": pl.String,
+    "artist_url": pl.String,
+    "year": pl.Int64,
+    "qwr": pl.Float64,
+    "average_rating": pl.Float64,
+    "user_ratings": pl.Int64,
+    "internal_id": pl.Int64,
+    "user_score": pl.Int64,
+    "reviews": pl.Int64,
+    "score_distribution": pl.Struct(
+        {f"{n}_stars": pl.Int64 for n in range(5, 0, -1)}
+    ),
+    "tracks": pl.List(
+        pl.Struct(
+            {
+                "track_disc": pl.String,
+                "track_number": pl.String,
+                "track_title": pl.String,
+                "track_length": pl.Duration("us"),
+                "subtracks": pl.List(pl.String),
+                "track_extras": pl.List(pl.String),
+            }
+        )
+    ),
+    "total_length": pl.Duration("us"),
+    "detail_date": pl.Datetime("us"),
+    "id": pl.String,
+}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+
+from src.defaults import path
+
+lock = Lock()
+
+
+def load(key: str, file: Path = path.BOUNDARIES) -> int | None:
+    with lock:
+        try:
+            return json.loads(file.read_text(encoding="utf-8")).get(key)
+        except (OSError, ValueError):
+            return None
+
+
+def save(key: str, page: int, file: Path = path.BOUNDARIES) -> None:
+    with lock:
+        try:
+            boundaries = json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            boundaries = {}
+        boundaries[key] = page
+        file.write_text(json.dumps(boundaries, indent=2), encoding="utf-8")
+
+
+def search(
+    relevant: Callable[[int], bool],
+    start: int = 1,
+    hint: int | None = None,
+) -> int:
+    """
+    Last page from `start` for which `relevant` holds, or `start - 1`.
+
+    Pages must be relevant up to some page and irrelevant after it, as in
+    a list sorted by score. The search gallops forward from `start` (or
+    from `hint`, the boundary found in a previous run) doubling the step,
+    then bisects the last step.
+    """
+    lo, hi = start - 1, None
+    if hint and hint >= start:
+        if relevant(hint):
+            lo = hint
+        else:
+            hi = hint
+    if hi is None:
+        step = 1
+        while relevant(lo + step):
+            lo += step
+            step *= 2
+        hi = lo + step
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if relevant(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
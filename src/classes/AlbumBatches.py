@@ -0,0 +1,91 @@
+from pathlib import Path
+from shutil import rmtree
+
+import polars as pl
+
+from src.classes.MusicList import MusicList
+from src.defaults import path
+from src.defaults.download import BATCH_SIZE
+
+
+class AlbumBatches:
+    """
+    Sink of downloaded albums, written to disk as columnar batches.
+
+    Albums are held as dicts only until `size` of them are gathered, then
+    converted to a DataFrame with the site's schema and written as an
+    Arrow IPC file, so memory doesn't grow with the number of albums.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schema: dict | None = None,
+        size: int = BATCH_SIZE,
+        directory: Path = path.BATCHES,
+    ):
+        self.directory = directory / name
+        self.schema = schema
+        self.size = size
+        self.batch = []  # type: list[dict]
+        self.files = []  # type: list[Path]
+        self.rows = 0
+        rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True)
+
+    def __len__(self) -> int:
+        return self.rows + len(self.batch)
+
+    def append(self, album: dict) -> None:
+        self.batch.append(album)
+        if len(self.batch) >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.batch:
+            return
+        file = self.directory / f"{len(self.files):06}.arrow"
+        pl.DataFrame(
+            self.batch,
+            schema_overrides=self.schema,
+            infer_schema_length=None,
+        ).write_ipc(file, compression="lz4")
+        self.files.append(file)
+        self.rows += len(self.batch)
+        self.batch.clear()
+
+    def __concat__(self, files: list[Path]) -> MusicList:
+        # Batches are scanned, not read, so they are copied once into the
+        # list instead of being read whole before joining them.
+        if not files:
+            return MusicList()
+        return MusicList(
+            pl.concat(
+                (pl.scan_ipc(f) for f in files),
+                how="diagonal_relaxed",
+            ).collect()
+        )
+
+    def collect(self) -> MusicList:
+        self.flush()
+        return self.__concat__(self.files)
+
+    def tracks(self) -> MusicList:
+        """
+        Tracks of the albums, exploded batch by batch (each written as a
+        batch of its own) rather than for the whole list at once.
+        """
+        self.flush()
+        files = []
+        for album_file in self.files:
+            file = album_file.with_suffix(".tracks.arrow")
+            MusicList(pl.read_ipc(album_file)).tracks().write_ipc(
+                file, compression="lz4"
+            )
+            files.append(file)
+        ml = self.__concat__(files)
+        ml.type = "tracks"
+        return ml
+
+    def remove(self) -> None:
+        rmtree(self.directory, ignore_errors=True)
@@ -117,13 +117,17 @@ class MusicList(pl.DataFrame):
             ],
             how="horizontal",
         ).drop("tracks")
-        ml = ml.with_columns(
-            (
-                pl.col("id").cast(pl.Utf8)
-                + pl.col("track_number").cast(pl.Utf8).str.zfill(4)
-                + pl.col("track_title").cast(pl.Utf8).str.slice(0, 5)
-            ).alias("track_id")
-        )
+        if "track_number" in ml.columns:
+            ml = ml.with_columns(
+                (
+                    pl.col("id").cast(pl.Utf8)
+                    + pl.col("track_number").cast(pl.Utf8).str.zfill(4)
+                    + pl.col("track_title").cast(pl.Utf8).str.slice(0, 5)
+                ).alias("track_id")
+            )
+        else:
+            # None of the albums has tracks.
+            ml = ml.with_columns(pl.lit(None, pl.Utf8).alias("track_id"))
         ml = MusicList(ml).get_attrs(self)
         ml.type = "tracks"
         return ml
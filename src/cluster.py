@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+import json
+from base64 import b64decode, b64encode
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+from urllib.request import Request, urlopen
+
+from src import deadletter, dump
+from src.deadletter import DeadLetters
+from src.debug import logging
+from src.defaults.download import POLL, TIMEOUT
+from src.frontier import Frontier
+from src.get import limit
+
+
+def encode(value):
+    # Values of the albums and units as JSON, keeping what JSON lacks.
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"__timedelta__": value.total_seconds()}
+    if isinstance(value, bytes):
+        return {"__bytes__": b64encode(value).decode("ascii")}
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode(v) for v in value]}
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: encode(v) for k, v in value.items()}
+    return value
+
+
+def decode(value):
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__timedelta__" in value:
+        return timedelta(seconds=value["__timedelta__"])
+    if "__bytes__" in value:
+        return b64decode(value["__bytes__"])
+    if "__tuple__" in value:
+        return tuple(decode(v) for v in value["__tuple__"])
+    return {k: decode(v) for k, v in value.items()}
+
+
+class Failures(list):
+    """
+    Failures of a worker, sent to the coordinator along with the unit.
+    """
+
+    def record(
+        self,
+        url: str,
+        error: BaseException | str,
+        album: dict | None = None,
+        unit: tuple | None = None,
+        rest: bool = False,
+    ) -> None:
+        logging.logger(self.record).warning(f"Failed {url}: {error}")
+        self.append(
+            {
+                "url": url,
+                "error": repr(error)
+                if isinstance(error, BaseException)
+                else error,
+                "album": dict(album) if album is not None else None,
+                "unit": unit,
+                "rest": rest,
+                "html": deadletter.html(url, error),
+            }
+        )
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "Coordinator"
+
+    def __send__(self, payload: dict) -> None:
+        body = json.dumps(encode(payload)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path != "/job":
+            self.send_error(404)
+            return
+        self.__send__(self.server.job)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        payload = decode(json.loads(self.rfile.read(length) or b"{}"))
+        if self.path == "/claim":
+            self.__send__(self.server.claim(payload.get("worker")))
+        elif self.path == "/done":
+            self.server.settle(payload)
+            self.__send__({})
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class Coordinator(ThreadingHTTPServer):
+    """
+    HTTP server handing out the units of a frontier to workers.
+
+    Workers get the `job` (what and how to download), then claim units and
+    send back their results (and failures), which are settled in the
+    frontier as a local download would. Workers of other machines reach it
+    with the same protocol, so it can be bound to any address.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        frontier: Frontier,
+        job: dict,
+        failed: DeadLetters | None = None,
+    ):
+        super().__init__(address, Handler)
+        self.frontier = frontier
+        self.job = job
+        self.failed = failed
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def claim(self, worker: str | None) -> dict:
+        if limit.exhausted():
+            return {"unit": None, "busy": False}
+        unit = self.frontier.claim(worker)
+        return {"unit": unit, "busy": unit is not None or self.frontier.busy()}
+
+    def settle(self, payload: dict) -> None:
+        unit, result = payload["unit"], payload["result"]
+        if self.failed is not None:
+            for f in payload.get("failed", []):
+                self.failed.record(
+                    f["url"],
+                    f["error"],
+                    album=f["album"],
+                    unit=f["unit"],
+                    page=f["html"],
+                    rest=f["rest"],
+                )
+        dump.settle(self.frontier, unit, result, self.job["type2"])
+
+    def start(self) -> "Coordinator":
+        Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def coordinate(
+    frontier: Frontier,
+    job: dict,
+    address: str,
+    failed: DeadLetters | None = None,
+    quiet: bool = False,
+) -> None:
+    """
+    Serve the units of `frontier` at `address` (as `HOST:PORT`), until
+    every unit is done or the download is out of time.
+    """
+    host, _, port = address.rpartition(":")
+    server = Coordinator(
+        (host or "127.0.0.1", int(port)), frontier, job, failed
+    ).start()
+    if not quiet:
+        print(
+            f"Waiting for workers on {server.url}, start them with "
+            + f"`musiclists download worker {server.url}`."
+        )
+    try:
+        while frontier.busy() and not limit.exhausted():
+            sleep(POLL)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def call(url: str, route: str, payload: dict | None = None) -> dict:
+    request = Request(
+        url.rstrip("/") + route,
+        data=None if payload is None else json.dumps(encode(payload)).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urlopen(request, timeout=TIMEOUT) as response:
+        return decode(json.loads(response.read()))
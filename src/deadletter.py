@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import pickle
+from collections.abc import Hashable, Iterator
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from urllib.error import HTTPError
+
+from src.debug import logging
+from src.defaults import path
+from src.get import cache, memo
+
+
+def html(url: str, error: BaseException | str) -> bytes | None:
+    # The page of an HTTP error comes with it, and other pages were fetched
+    # (and kept for a while) before failing, or are in the cache.
+    if isinstance(error, HTTPError) and isinstance(error.fp, BytesIO):
+        return error.fp.getvalue()
+    body = memo.BODIES.peek(url)
+    if body is None and cache.STORE.enabled:
+        cached = cache.STORE.get(url)
+        body = cached[1] if cached else None
+    return body
+
+
+class DeadLetters:
+    """
+    Store of the pages and records that failed during a download.
+
+    Each entry keeps the failed URL, the error, the raw HTML of the page
+    (when it was fetched) and either the partially parsed album or the
+    list unit (type and page, or genre and type) that failed, so that the
+    download goes on and they can be retried later on their own. Units of
+    lists without a known end keep whether the rest of the list (the pages
+    after them) is missing as well.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: dict | None = None,
+        clear: bool = False,
+        directory: Path = path.FAILED,
+    ):
+        self.file = directory / f"{name}.failed"
+        self.params = params
+        self.lock = Lock()
+        if clear:
+            self.file.unlink(missing_ok=True)
+
+    def __iter__(self) -> Iterator[dict]:
+        if not self.file.exists():
+            return
+        with open(self.file, "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except (EOFError, pickle.UnpicklingError, ValueError):
+                    break  # An entry interrupted while being written.
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def record(
+        self,
+        url: str,
+        error: BaseException | str,
+        album: dict | None = None,
+        unit: tuple[Hashable, Hashable] | None = None,
+        page: bytes | None = None,
+        rest: bool = False,
+    ) -> None:
+        logger = logging.logger(self.record)
+        logger.warning(f"Failed {url}: {error}")
+        entry = {
+            "url": url,
+            "error": error if isinstance(error, str) else repr(error),
+            "album": dict(album) if album is not None else None,
+            "unit": unit,
+            "rest": rest,
+            "params": self.params,
+            "html": page if page is not None else html(url, error),
+            "date": datetime.now(),
+        }
+        with self.lock:
+            with open(self.file, "ab") as f:
+                pickle.dump(entry, f)
+
+    def replace(self, entries: list[dict]) -> None:
+        with self.lock:
+            if not entries:
+                self.file.unlink(missing_ok=True)
+                return
+            with open(self.file, "wb") as f:
+                for entry in entries:
+                    pickle.dump(entry, f)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+"""
+Offline benchmark of the page parsing, over the pages in `fixtures`.
+
+Every stage is timed on its own: `table()` parses the page (the memo is
+cleared before each run), while the extraction stages run over an already
+parsed page. The results are printed as JSON, to compare between versions:
+
+    python -m src.debug.benchmark --repeat 50 > before.json
+"""
+
+import json
+import platform
+import sys
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+from statistics import mean, median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import click
+from bs4.builder import builder_registry
+
+from src.attributes import aoty as aoty_tags, prog as prog_tags
+from src.defaults import defaults
+from src.defaults.download import AOTY_URL, PARSERS, PROG_URL
+from src.get import archive, data, memo
+from src.get.connection import Response
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGES = {
+    "aoty_list": f"{AOTY_URL}/ratings/user-highest-rated/lp/all/1/",
+    "aoty_album": f"{AOTY_URL}/album/1000-glass-river-night-garden.php",
+    "prog_genres": PROG_URL,
+    "prog_list": f"{PROG_URL}/top-prog-albums.asp"
+    + "?ssubgenres=18&salbumtypes=1&smaxresults=250#list",
+    "prog_album": f"{PROG_URL}/album.asp?id=2000",
+}
+REPEAT = 20
+
+
+@contextmanager
+def fixtures(directory: Path = FIXTURES):
+    # The fixtures are served by an offline archive, so that the pages go
+    # through the same `page()` and `table()` code as a download.
+    previous = archive.STORE
+    with TemporaryDirectory() as tmp:
+        archive.STORE = archive.Archive(directory=Path(tmp), offline=True)
+        for name, url in PAGES.items():
+            body = (directory / f"{name}.html").read_bytes()
+            archive.STORE.put(url, Response(url, 200, "OK", {}, body))
+        try:
+            yield
+        finally:
+            archive.STORE = previous
+            memo.clear()
+
+
+def aoty_list():
+    return data.table(
+        url=PAGES["aoty_list"],
+        id="centerContent",
+        strainer=aoty_tags.list_page,
+    )
+
+
+def aoty_album():
+    return data.table(
+        url=PAGES["aoty_album"],
+        id="centerContent",
+        strainer=aoty_tags.album_page,
+    )
+
+
+def prog_list():
+    return data.table(
+        url=PAGES["prog_list"],
+        tag="table",
+        number=1,
+        encoding="latin1",
+        strainer=prog_tags.list_page,
+    )
+
+
+def prog_album():
+    return data.table(
+        url=PAGES["prog_album"],
+        tag="td",
+        encoding="latin1",
+        strainer=prog_tags.album_page,
+    )
+
+
+def extract(rows, tags: dict) -> list[dict]:
+    albums = []
+    for row in rows:
+        album = {}
+        data.data(element=row, data_struct=album, tags=tags)
+        albums.append(album)
+    return albums
+
+
+def stages() -> dict[str, tuple[Callable, bool]]:
+    # Name: (function, whether the page has to be parsed in every run).
+    return {
+        "aoty_list_table": (aoty_list, True),
+        "aoty_list_data": (
+            lambda: extract(
+                aoty_list().find_all(class_="albumListRow"),
+                aoty_tags.album_list,
+            ),
+            False,
+        ),
+        "aoty_album_table": (aoty_album, True),
+        "aoty_album_data": (
+            lambda: extract((aoty_album(),), aoty_tags.album),
+            False,
+        ),
+        "aoty_tracks": (
+            lambda: data.aoty_tracks(url=PAGES["aoty_album"])[0],
+            False,
+        ),
+        "prog_genres": (
+            lambda: data.prog_genres(prog_url=PAGES["prog_genres"]),
+            True,
+        ),
+        "prog_list_table": (prog_list, True),
+        "prog_list_data": (
+            lambda: extract(
+                prog_list().find_all("tr"),
+                prog_tags.album_list,
+            ),
+            False,
+        ),
+        "prog_album_table": (prog_album, True),
+        "prog_album_data": (
+            lambda: extract((prog_album(),), prog_tags.album),
+            False,
+        ),
+        "prog_tracks": (
+            lambda: data.prog_tracks(PAGES["prog_album"])[0],
+            False,
+        ),
+        "prog_distribution_score": (
+            lambda: data.prog_distribution_score(PAGES["prog_album"]),
+            False,
+        ),
+    }
+
+
+def count(result) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return 1
+
+
+def measure(function: Callable, parse: bool, repeat: int = REPEAT) -> dict:
+    function()  # Warm up, and parse the page for the extraction stages.
+    times = []
+    for _ in range(repeat):
+        if parse:
+            memo.clear()
+        start = perf_counter()
+        result = function()
+        times.append((perf_counter() - start) * 1000)
+    return {
+        "items": count(result),
+        "runs": repeat,
+        "min_ms": round(min(times), 4),
+        "median_ms": round(median(times), 4),
+        "mean_ms": round(mean(times), 4),
+    }
+
+
+def benchmark(
+    parsers: tuple[str, ...] = PARSERS,
+    repeat: int = REPEAT,
+    directory: Path = FIXTURES,
+) -> dict:
+    results = {}
+    previous = dict(data.PARSERS)
+    with fixtures(directory):
+        for parser in parsers:
+            if builder_registry.lookup(parser) is None:
+                continue
+            for url in (AOTY_URL, PROG_URL):
+                data.use_parser(url, parser)
+            memo.clear()
+            results[parser] = {
+                name: measure(function, parse, repeat)
+                for name, (function, parse) in stages().items()
+            }
+    data.PARSERS.update(previous)
+    return {
+        "version": defaults.VERSION,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "parsers": results,
+    }
+
+
+@click.command()
+@click.option(
+    "-r",
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=REPEAT,
+    show_default=True,
+    help="Runs of every stage.",
+)
+@click.option(
+    "-p",
+    "--parser",
+    "parsers",
+    type=click.Choice(PARSERS),
+    multiple=True,
+    default=PARSERS,
+    show_default=True,
+    help="Parsers to benchmark, when installed.",
+)
+def main(repeat: int, parsers: tuple[str, ...]) -> None:
+    json.dump(benchmark(parsers=parsers, repeat=repeat), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
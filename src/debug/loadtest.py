@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+"""
+End to end benchmark of a download against the local mock server.
+
+The server of `src.debug.server` is started in the background, a whole
+list is downloaded from it, and the throughput is printed as JSON:
+
+    python -m src.debug.loadtest aoty --latency 0.1 -j 16 -w 4
+"""
+
+import json
+import sys
+from time import perf_counter
+
+import click
+import polars as pl
+
+from src import download
+from src.deadletter import DeadLetters
+from src.debug.server import GENRES, PAGES, PORT, MockServer
+from src.defaults.download import CONCURRENCY, PROCESSES, WORKERS
+from src.get import connection, file
+
+SITES = ("aoty", "prog")
+
+
+def __remove__(name: str) -> None:
+    for type_ in ("albums", "tracks"):
+        file.path(name, type_, "download").unlink(missing_ok=True)
+    DeadLetters(name, clear=True)
+
+
+def loadtest(
+    site: str = "aoty",
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    processes: int = PROCESSES,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    throttle_rate: float = 0.0,
+    pages: int = PAGES,
+    genres: int = GENRES,
+    port: int = PORT,
+    tracks: bool = True,
+) -> dict:
+    name = f"{site}-loadtest"
+    server = MockServer(
+        port=port,
+        latency=latency,
+        error_rate=error_rate,
+        throttle_rate=throttle_rate,
+        pages=pages,
+        genres=genres,
+    ).start()
+    requests = connection.stats()["requests"]
+    start = perf_counter()
+    try:
+        (download.aoty if site == "aoty" else download.prog)(
+            field=name,
+            types=("LP",) if site == "aoty" else ("Studio",),
+            min_score=0,
+            max_score=100,
+            concurrency=concurrency,
+            workers=workers,
+            processes=processes,
+            cache=False,
+            fields=("details", "tracks") if tracks else ("details",),
+            base_url=server.url,
+            quiet=True,
+        )
+        elapsed = perf_counter() - start
+        albums = pl.DataFrame.deserialize(
+            file.path(name, "albums", "download")
+        )
+        failed = len(DeadLetters(name))
+    finally:
+        server.shutdown()
+        server.server_close()
+        __remove__(name)
+    return {
+        "site": site,
+        "concurrency": concurrency,
+        "workers": workers,
+        "processes": processes,
+        "latency": latency,
+        "error_rate": error_rate,
+        "throttle_rate": throttle_rate,
+        "albums": len(albums),
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "albums_per_second": round(len(albums) / elapsed, 2),
+        "requests": connection.stats()["requests"] - requests,
+        "server": server.stats(),
+        "throttles": connection.throttles(),
+    }
+
+
+@click.command()
+@click.argument("site", type=click.Choice(SITES), default="aoty")
+@click.option(
+    "-j",
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=CONCURRENCY,
+    show_default=True,
+    help="Number of album pages to download concurrently.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=WORKERS,
+    show_default=True,
+    help="Number of album types or genres to download at the same time.",
+)
+@click.option(
+    "-p",
+    "--processes",
+    type=click.IntRange(min=0),
+    default=PROCESSES,
+    show_default=True,
+    help="Number of processes parsing the album pages, or 0 to parse them "
+    + "while downloading.",
+)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Seconds every response is delayed.",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Rate of responses failing with a 500.",
+)
+@click.option(
+    "--throttle-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Rate of responses throttled with a 429.",
+)
+@click.option(
+    "--pages",
+    type=click.IntRange(min=1),
+    default=PAGES,
+    show_default=True,
+    help="List pages of every AOTY type and ProgArchives list.",
+)
+@click.option(
+    "--genres",
+    type=click.IntRange(min=1),
+    default=GENRES,
+    show_default=True,
+    help="ProgArchives genres.",
+)
+@click.option(
+    "--port",
+    type=click.INT,
+    default=PORT,
+    show_default=True,
+    help="Port of the mock server.",
+)
+@click.option(
+    "--tracks/--no-tracks",
+    default=True,
+    show_default=True,
+    help="Download the tracklist of each album.",
+)
+def main(**kwargs) -> None:
+    json.dump(loadtest(**kwargs), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""
+Local stand-in for AlbumOfTheYear.org and ProgArchives.com.
+
+It serves synthetic list, album and tracklist pages in the markup that the
+specs of `src.attributes` expect, with a configurable latency, rate of
+errors and rate of throttled (429) responses, to tune the crawler without
+touching the real websites:
+
+    python -m src.debug.server --latency 0.2 --throttle-rate 0.05
+    musiclists download aoty --base-url http://127.0.0.1:8765
+    musiclists download prog --base-url http://127.0.0.1:8765
+"""
+
+import gzip
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from random import Random
+from threading import Lock, Thread
+from time import sleep
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+HOST = "127.0.0.1"
+PORT = 8765
+PAGES = 4  # Of 25 albums, in every AOTY type and ProgArchives list.
+GENRES = 3
+PER_PAGE = 25
+TRACKS = 10
+RETRY_AFTER = 1
+ERROR_PAGE = b"<html><body><h1>Internal Server Error</h1></body></html>"
+
+AOTY_LIST = re.compile(r"/ratings/user-highest-rated/([^/]+)/([^/]+)/(\d+)/")
+AOTY_ALBUM = re.compile(r"/album/(\d+)-")
+
+
+def __key__(text: str) -> int:
+    return sum(ord(c) * 31**i for i, c in enumerate(text)) % 1000
+
+
+def __score__(i: int, pages: int) -> int:
+    # From 100 for the first album down to 50 for the last one.
+    return 100 - i * 50 // max(1, pages * PER_PAGE)
+
+
+def aoty_list(
+    album_type: str,
+    page: int,
+    pages: int = PAGES,
+    year: int | None = None,
+) -> str:
+    rows = []
+    offset = year * 10_000 if year else 0  # Albums of their own by year.
+    if page <= pages:
+        for i in range((page - 1) * PER_PAGE, page * PER_PAGE):
+            album_id = __key__(album_type) * 100_000_000 + offset + i
+            url = f"/album/{album_id}-artist-{i}-album-{i}.php"
+            rows.append(
+                '<div class="albumListRow">'
+                + f'<span class="albumListRank"><span>{i + 1}</span></span>'
+                + f'<h2 class="albumListTitle"><a href="{url}">'
+                + f"Artist {i} - Album {i}</a></h2>"
+                + '<div class="albumListScoreContainer">'
+                + f'<div class="scoreValue">{__score__(i, pages)}</div>'
+                + f'<div class="scoreText">{1000 + i:,} ratings</div>'
+                + "</div></div>"
+            )
+    return (
+        '<html><body><div id="centerContent">'
+        + "".join(rows)
+        + "</div></body></html>"
+    )
+
+
+def aoty_album(album_id: int, pages: int = PAGES) -> str:
+    i = album_id % 10_000
+    year = album_id // 10_000 % 10_000 or 2000 + i % 25
+    tracks = "".join(
+        f'<tr><td class="trackNumber">{n}</td><td class="trackTitle">'
+        + f'<a href="/song/{album_id}{n:02d}-track-{n}.php">Track {n}</a>'
+        + f'<div class="length">{n % 7 + 2}:{n * 7 % 60:02d}</div></td>'
+        + '<td class="trackRating">'
+        + f'<span title="{n * 10} Ratings">{90 - n}</span></td></tr>'
+        for n in range(1, TRACKS + 1)
+    )
+    return f"""<html><body><div id="centerContent">
+<div class="albumTopBox cover"><img src="/covers/{album_id}.jpg"></div>
+<div class="artist"><span><a href="/artist/{i}-artist-{i}/">Artist {i}</a>
+</span></div>
+<div class="albumTitle"><span>Album {i}</span></div>
+<div class="detailRow">1 <a href="/releases/">January</a>
+<a href="/{year}/releases/">{year}</a></div>
+<div class="detailRow"><a href="/format/lp/">LP</a></div>
+<div class="detailRow"><a href="/label/1-label/">Label</a></div>
+<div class="detailRow"><a href="/genre/1-rock/">Rock</a></div>
+<div class="detailRow"><a href="/producer/1-producer/">Producer</a></div>
+<div class="detailRow"><a href="/writer/1-writer/">Writer</a></div>
+<div class="albumCriticScore"><a href="#critics">80</a></div>
+<div class="text numReviews"><span>{i % 40 + 1}</span></div>
+<div class="albumUserScore"><a>{__score__(i, pages)}</a></div>
+<div class="albumUserScoreBox"><strong>{1000 + i:,}</strong></div>
+<div id="tracklist"><table>{tracks}</table></div>
+</div></body></html>"""
+
+
+def prog_genres(genres: int = GENRES) -> str:
+    return (
+        '<html><body><div id="navGenre"><ul>'
+        + "".join(
+            f'<li><a href="subgenre.asp?style={g}">Genre {g}</a></li>'
+            for g in range(1, genres + 1)
+        )
+        + "</ul></div></body></html>"
+    )
+
+
+def prog_list(genre: int, album_type: int, pages: int = PAGES) -> str:
+    albums = pages * PER_PAGE
+    rows = []
+    for i in range(albums):
+        album_id = genre * 1_000_000 + album_type * 100_000 + i
+        rows.append(
+            f"<tr><td><strong>{i + 1}</strong></td>"
+            + f'<td><img src="covers/{album_id}.jpg"></td>'
+            + f'<td><a href="album.asp?id={album_id}"><strong>Album {i}'
+            + f'</strong></a><br/><a href="artist.asp?id={album_id}">'
+            + f"Artist {i}</a><br/>Studio Album, {1970 + i % 50}</td>"
+            + f"<td><div>ratings</div><div>QWR = {5 - i * 2.5 / albums:.2f}"
+            + f"</div><span>{4.5 - i * 2 / albums:.2f}</span> | "
+            + f"<span>{100 + i}</span> ratings</td></tr>"
+        )
+    return (
+        "<html><body><table><tr><td>Search</td></tr></table>"
+        + f"<table>{''.join(rows)}</table></body></html>"
+    )
+
+
+def prog_album(album_id: int) -> str:
+    tracks = "<br/>".join(
+        f"{n}. Track {n} ({n % 7 + 2}:{n * 7 % 60:02d})"
+        for n in range(1, TRACKS + 1)
+    )
+    return f"""<html><body><table><tr><td>
+<span>Album</span><span>Artist</span><span>Genre</span><span>Year</span>
+<span>Rating</span><span>{album_id % 300}</span>
+<blockquote><img src="stars.gif"><div>Rating</div>
+40%
+<br/>30%
+<br/>20%
+<br/>6%
+<br/>4%
+</blockquote></td>
+<td><p>{tracks}<br/></p></td></tr></table></body></html>"""
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "MockServer"
+
+    def __page__(self) -> str | None:
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        pages = self.server.pages
+        if m := AOTY_LIST.fullmatch(url.path):
+            year = None if m[2] == "all" else int(m[2])
+            return aoty_list(m[1], int(m[3]), pages, year)
+        if m := AOTY_ALBUM.match(url.path):
+            return aoty_album(int(m[1]), pages)
+        if url.path == "/":
+            return prog_genres(self.server.genres)
+        if url.path == "/top-prog-albums.asp":
+            return prog_list(
+                int(query["ssubgenres"][0]),
+                int(query["salbumtypes"][0]),
+                pages,
+            )
+        if url.path == "/album.asp":
+            return prog_album(int(query["id"][0]))
+        return None
+
+    def __send__(self, status: int, body: bytes = b"", **headers) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k.replace("_", "-"), str(v))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        outcome = self.server.outcome()
+        sleep(self.server.latency)
+        if outcome == "throttled":
+            self.__send__(429, Retry_After=RETRY_AFTER)
+            return
+        if outcome == "error":
+            self.__send__(500, ERROR_PAGE)
+            return
+        try:
+            page = self.__page__()
+        except (KeyError, ValueError):
+            page = None
+        if page is None:
+            self.__send__(404)
+            return
+        body = page.encode("latin1" if ".asp" in self.path else "utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.__send__(200, gzip.compress(body), Content_Encoding="gzip")
+        else:
+            self.__send__(200, body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Threaded server of synthetic AOTY and ProgArchives pages.
+
+    Every request waits `latency` seconds, and fails with a 429 (and a
+    `Retry-After` header) or a 500 at the given rates.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = HOST,
+        port: int = PORT,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        pages: int = PAGES,
+        genres: int = GENRES,
+        seed: int | None = None,
+    ):
+        super().__init__((host, port), Handler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.pages = pages
+        self.genres = genres
+        self.random = Random(seed)
+        self.lock = Lock()
+        self.counters = dict.fromkeys(("requests", "throttled", "errors"), 0)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def outcome(self) -> str:
+        with self.lock:
+            self.counters["requests"] += 1
+            draw = self.random.random()
+            if draw < self.throttle_rate:
+                self.counters["throttled"] += 1
+                return "throttled"
+            if draw < self.throttle_rate + self.error_rate:
+                self.counters["errors"] += 1
+                return "error"
+        return "ok"
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+    def start(self) -> "MockServer":
+        Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+@click.command()
+@click.option("--host", default=HOST, show_default=True)
+@click.option("--port", type=click.INT, default=PORT, show_default=True)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Seconds every response is delayed.",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Rate of responses failing with a 500.",
+)
+@click.option(
+    "--throttle-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Rate of responses throttled with a 429.",
+)
+@click.option(
+    "--pages",
+    type=click.IntRange(min=0),
+    default=PAGES,
+    show_default=True,
+    help="List pages of every AOTY type and ProgArchives list.",
+)
+@click.option(
+    "--genres",
+    type=click.IntRange(min=1),
+    default=GENRES,
+    show_default=True,
+    help="ProgArchives genres.",
+)
+def main(**kwargs) -> None:
+    server = MockServer(**kwargs)
+    print(f"Serving on {server.url}, stop with Ctrl+C.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.attributes import aoty as aoty_tags
+from src.classes.AlbumBatches import AlbumBatches
+
+TRACKS = [
+    {"track_number": 1, "track_title": "First"},
+    {"track_number": 2, "track_title": "Second"},
+]
+
+
+class AlbumBatchesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.batches = AlbumBatches(
+            "test",
+            schema=aoty_tags.schema,
+            size=2,
+            directory=Path(self.tmp.name),
+        )
+        # The second batch has no tracks at all.
+        for i, tracks in enumerate((TRACKS, TRACKS, None, None, TRACKS)):
+            self.batches.append({"id": f"a{i}", "tracks": tracks})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_collect(self):
+        ml = self.batches.collect()
+        self.assertEqual(len(ml), 5)
+        self.assertEqual(len(self.batches.files), 3)
+        self.assertEqual(ml["id"].to_list(), [f"a{i}" for i in range(5)])
+
+    def test_tracks(self):
+        ml = self.batches.tracks()
+        self.assertEqual(ml.type, "tracks")
+        self.assertEqual(
+            ml["id"].to_list(),
+            ["a0", "a0", "a1", "a1", "a2", "a3", "a4", "a4"],
+        )
+        self.assertEqual(
+            ml["track_id"].to_list(),
+            ["a00001First", "a00002Secon", "a10001First", "a10002Secon"]
+            + [None, None, "a40001First", "a40002Secon"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src import boundary
+
+
+class Pages:
+    # Pages relevant up to `last`, counting the ones looked at.
+
+    def __init__(self, last: int):
+        self.last = last
+        self.seen = []
+
+    def __call__(self, page: int) -> bool:
+        self.seen.append(page)
+        return page <= self.last
+
+
+class BoundaryTestCase(unittest.TestCase):
+    def test_search(self):
+        for start in (1, 3):
+            for last in range(start - 1, 70):
+                with self.subTest(start=start, last=last):
+                    self.assertEqual(
+                        boundary.search(Pages(last), start=start), last
+                    )
+
+    def test_search_with_hint(self):
+        for last in range(0, 40):
+            for hint in (1, last - 1, last, last + 1, 2 * last + 5):
+                with self.subTest(last=last, hint=hint):
+                    self.assertEqual(
+                        boundary.search(Pages(last), hint=hint), last
+                    )
+
+    def test_pages_looked_at(self):
+        # Galloping: about 2 log2(last) pages, not every page.
+        pages = Pages(1000)
+        self.assertEqual(boundary.search(pages), 1000)
+        self.assertLessEqual(len(pages.seen), 2 * 10 + 2)
+        # With the right hint, the hint and the next page.
+        pages = Pages(1000)
+        self.assertEqual(boundary.search(pages, hint=1000), 1000)
+        self.assertEqual(pages.seen, [1000, 1001])
+
+    def test_load_and_save(self):
+        with TemporaryDirectory() as tmp:
+            file = Path(tmp) / "boundaries.json"
+            self.assertIsNone(boundary.load("lp", file=file))
+            boundary.save("lp", 12, file=file)
+            boundary.save("ep", 3, file=file)
+            self.assertEqual(boundary.load("lp", file=file), 12)
+            self.assertEqual(boundary.load("ep", file=file), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
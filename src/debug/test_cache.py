@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src import dump
+from src.classes.Album import Album
+from src.debug.server import MockServer
+from src.get import cache
+from src.get.cache import Cache
+
+
+class CacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockServer(port=0).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.cache = Cache(directory=Path(self.tmp.name), enabled=True)
+        self.url = f"{self.server.url}/album/1001-volatile-album.php"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def requests(self) -> int:
+        return self.server.stats()["requests"]
+
+    def test_fresh_page(self):
+        self.cache.fetch(self.url)
+        requests = self.requests()
+        self.cache.fetch(self.url)
+        self.assertEqual(self.requests(), requests)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_expired_page(self):
+        # A volatile album, refreshed while its page is still fresh in the
+        # cache, is downloaded again (once).
+        body = self.cache.fetch(self.url).body
+        requests = self.requests()
+        self.cache.expire((self.url,))
+        self.assertEqual(self.cache.fetch(self.url).body, body)
+        self.assertEqual(self.requests(), requests + 1)
+        self.cache.fetch(self.url)
+        self.assertEqual(self.requests(), requests + 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_reuse_expires_old_details(self):
+        album = Album({"internal_id": 1001, "user_score": 90})
+        known = {
+            1001: {
+                "internal_id": 1001,
+                "genre": ["Rock"],
+                "detail_date": datetime.now() - timedelta(days=40),
+            }
+        }
+        self.assertIsNotNone(dump.reuse(album, self.url, known, max_age=60))
+        self.assertNotIn(self.url, cache.STORE.stale)
+        self.assertIsNone(dump.reuse(album, self.url, known, max_age=30))
+        self.assertIn(self.url, cache.STORE.stale)
+        cache.STORE.stale.discard(self.url)
+
+
+if __name__ == "__main__":
+    unittest.main()
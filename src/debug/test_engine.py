@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import unittest
+from functools import partial
+from threading import Lock
+from time import sleep
+
+from src.get.engine import Engine
+
+
+class Jobs:
+    # Jobs returning their number, counting the ones started.
+
+    def __init__(self):
+        self.started = []
+        self.lock = Lock()
+
+    def __call__(self, number: int) -> int:
+        with self.lock:
+            self.started.append(number)
+        sleep(0.01)
+        return number
+
+
+class EngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.engine = Engine(concurrency=8)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_run_in_order(self):
+        jobs = Jobs()
+        self.assertEqual(
+            self.engine.run((partial(jobs, n) for n in range(50)), 4),
+            list(range(50)),
+        )
+        self.assertEqual(sorted(jobs.started), list(range(50)))
+
+    def test_stream_window(self):
+        jobs = Jobs()
+        results = self.engine.stream((partial(jobs, n) for n in range(50)), 4)
+        for n in range(10):
+            self.assertEqual(next(results), n)
+            # The jobs of the results taken, and up to 4 more.
+            self.assertLessEqual(len(jobs.started), n + 1 + 4)
+        results.close()
+        sleep(0.1)
+        self.assertLessEqual(len(jobs.started), 10 + 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+import re
+import unittest
+
+from bs4 import BeautifulSoup
+
+from src.attributes import aoty as aoty_tags, prog as prog_tags
+from src.debug import benchmark
+from src.get import extract
+
+
+def find_tag(element, values):
+    if "tag" in values:
+        if "class" in values:
+            d = element.find_all(
+                values["tag"], class_=values["class"], recursive=True
+            )
+        else:
+            d = element.find_all(values["tag"])
+        i = values["number"] if "number" in values else 0
+        if len(d) > abs(i + 1 if i < 0 else i):
+            return d[i]
+        else:
+            return None
+    else:
+        return element
+
+
+def data(element, data_struct: dict, tags: dict, include_none: bool):
+    # `data()` as it was before the extractors, as the reference.
+    for k, v in tags.items():
+        d = find_tag(element=element, values=v)
+        if d and "subtag" in v:
+            d = find_tag(element=d, values=v["subtag"])
+        if d and "key" in v:
+            d = d.get(v["key"])
+        if d and "contains" in v and isinstance(v["contains"], dict):
+            data_struct[k] = None
+            data(d, data_struct, dict(v["contains"]), include_none)
+        if d and "expand" in v:
+            if "expand_url" in v:
+                d = list(
+                    {v["expand_url"]: e.get_text(), "url": e.get("href")}
+                    for e in d.find_all(v["expand"])
+                    if e.get("href") != "#"
+                )
+            else:
+                d = list(e.get_text() for e in d.find_all(v["expand"]))
+        if d and ("type" in v or "replace" in v or "match" in v):
+            if not isinstance(d, str) and (
+                any(v["type"] == t for t in ("str", "int", "float"))
+            ):
+                d = d.get_text().strip()
+            if "match" in v:
+                d = re.search(v["match"], d)
+                d = d.group() if d else None
+            if "replace" in v and isinstance(v["replace"], dict):
+                for kr, vr in v["replace"].items():
+                    d = d.replace(kr, vr)
+            if any(v["type"] == t for t in ("int", "float")):
+                d = (
+                    int(d)
+                    if v["type"] == "int" and d.isdigit()
+                    else float(d)
+                    if v["type"] == "float" and d.replace(".", "", 1).isdigit()
+                    else None
+                )
+        if d:
+            data_struct[k] = d
+        elif include_none:
+            data_struct[k] = None
+
+
+class ExtractorTestCase(unittest.TestCase):
+    with benchmark.fixtures():
+        pages = {
+            "aoty_list": (
+                benchmark.aoty_list().find_all(class_="albumListRow"),
+                aoty_tags.album_list,
+            ),
+            "aoty_album": ((benchmark.aoty_album(),), aoty_tags.album),
+            "prog_list": (
+                benchmark.prog_list().find_all("tr"),
+                prog_tags.album_list,
+            ),
+            "prog_album": ((benchmark.prog_album(),), prog_tags.album),
+        }
+
+    def test_same_as_reference(self):
+        for name, (rows, tags) in self.pages.items():
+            for include_none in (False, True):
+                for row in rows:
+                    with self.subTest(page=name, include_none=include_none):
+                        expected, extracted = {}, {}
+                        data(row, expected, tags, include_none)
+                        extract.extractor(tags).extract(
+                            row, extracted, include_none=include_none
+                        )
+                        self.assertEqual(
+                            list(extracted.items()), list(expected.items())
+                        )
+
+    def test_rows_extracted(self):
+        for name, (rows, tags) in self.pages.items():
+            with self.subTest(page=name):
+                self.assertTrue(rows)
+                album = {}
+                extract.extractor(tags).extract(rows[0], album)
+                self.assertTrue(album)
+
+    def test_prog_year(self):
+        rows, tags = self.pages["prog_list"]
+        album = {}
+        extract.extractor(tags).extract(rows[0], album)
+        self.assertEqual(album.get("year"), 1968)
+
+    def test_match_missed(self):
+        # Rows where the regex of a field finds nothing: no year, and no
+        # count of ratings.
+        rows = {
+            "prog_list": (
+                "<tr><td>1</td><td><a href='album.asp?id=1'><strong>A"
+                + "</strong></a><br/>Studio Album<br/>Rock</td></tr>",
+                prog_tags.album_list,
+                "year",
+            ),
+            "aoty_list": (
+                "<div class='albumListRow'><div class='scoreText'>"
+                + "no ratings</div></div>",
+                aoty_tags.album_list,
+                "user_ratings",
+            ),
+        }
+        for name, (html, tags, field) in rows.items():
+            with self.subTest(page=name):
+                row = BeautifulSoup(html, "html.parser").find()
+                album = {}
+                extract.extractor(tags).extract(row, album, include_none=True)
+                self.assertIn(field, album)
+                self.assertIsNone(album[field])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src import dump
+from src.frontier import Frontier
+
+PARAMS = {"types": ("lp", "ep"), "min_score": 80}
+
+
+class FrontierTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.frontier = Frontier(
+            "test", PARAMS, directory=Path(self.tmp.name), lease=60
+        )
+
+    def tearDown(self):
+        self.frontier.remove()
+        self.tmp.cleanup()
+
+    def test_claim_in_order(self):
+        # The first pages of every list come before the next ones.
+        self.frontier.add(
+            (a, p, shard, p, p, True)
+            for shard, a in enumerate(("lp", "ep"))
+            for p in (1, 2)
+        )
+        claimed = []
+        while (unit := self.frontier.claim("test")) is not None:
+            claimed.append((unit["a"], unit["b"]))
+        self.assertEqual(
+            claimed, [("lp", 1), ("ep", 1), ("lp", 2), ("ep", 2)]
+        )
+        self.assertTrue(self.frontier.busy())
+
+    def test_claimed_once(self):
+        self.frontier.add(("lp", p, 0, p, p, True) for p in range(50))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            claims = list(
+                executor.map(
+                    lambda i: self.frontier.claim(f"worker {i}"), range(60)
+                )
+            )
+        pages = [u["b"] for u in claims if u is not None]
+        self.assertEqual(sorted(pages), list(range(50)))
+
+    def test_lease(self):
+        self.frontier.add((("lp", 1, 0, 1, 1, True),))
+        self.frontier.claim("gone")
+        self.assertIsNone(self.frontier.claim("other"))
+        # Units of a process gone for longer than the lease are claimed
+        # again.
+        self.frontier.lease = 0
+        unit = self.frontier.claim("other")
+        self.assertEqual(unit["attempts"], 2)
+
+    def test_release(self):
+        self.frontier.add((("lp", 1, 0, 1, 1, True),))
+        self.frontier.claim("test")
+        self.frontier.release("lp", 1)
+        self.assertEqual(self.frontier.claim("test")["b"], 1)
+
+    def test_finish_once(self):
+        self.frontier.add((("lp", 1, 0, 1, 1, True),))
+        self.assertFalse(self.frontier.finish("first"))
+        self.frontier.claim("first")
+        self.frontier.done("lp", 1, [{"album": "A"}], True)
+        self.assertFalse(self.frontier.busy())
+        self.assertTrue(self.frontier.finish("first"))
+        self.assertFalse(self.frontier.finish("second"))
+
+    def test_albums_up_to_the_last_page(self):
+        # A list searched first, as AOTY types, with its next pages added
+        # once the search is settled.
+        dump.seed(self.frontier, ("lp",), 1)
+        search = self.frontier.claim("test")
+        self.assertIsNone(search["b"])
+        dump.settle(self.frontier, search, {"last": None}, 1)
+        albums = {1: [{"album": "A"}], 2: [{"album": "B"}], 3: []}
+        while (unit := self.frontier.claim("test")) is not None:
+            b = unit["b"]
+            dump.settle(
+                self.frontier,
+                unit,
+                {"albums": albums[b], "found_limit": b == 2},
+                1,
+            )
+        self.assertFalse(self.frontier.busy())
+        self.assertEqual(
+            list(self.frontier.albums()), [{"album": "A"}, {"album": "B"}]
+        )
+
+    def test_other_params(self):
+        self.frontier.add((("lp", 1, 0, 1, 1, True),))
+        frontier = Frontier(
+            "test", {"types": ("ep",)}, directory=Path(self.tmp.name)
+        )
+        self.assertFalse(frontier.busy())
+
+
+if __name__ == "__main__":
+    unittest.main()
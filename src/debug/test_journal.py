@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.journal import Journal
+
+PARAMS = {"types": ("lp",), "min_score": 80}
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def journal(self, params: dict = PARAMS, resume: bool = True):
+        return Journal("test", params, resume=resume, directory=self.directory)
+
+    def test_resume(self):
+        journal = self.journal(resume=False)
+        journal.record(("lp", 1), [{"album": "A"}, {"album": "B"}], False)
+        journal.record(("lp", 2), [{"album": "C"}], True)
+        journal = self.journal()
+        self.assertEqual(len(journal), 2)
+        self.assertIn(("lp", 1), journal)
+        self.assertNotIn(("lp", 3), journal)
+        self.assertEqual(
+            journal[("lp", 1)], ([{"album": "A"}, {"album": "B"}], False)
+        )
+        self.assertEqual(journal[("lp", 2)], ([{"album": "C"}], True))
+
+    def test_interrupted_unit(self):
+        journal = self.journal(resume=False)
+        journal.record(("lp", 1), [{"album": "A"}], False)
+        size = journal.file.stat().st_size
+        journal.record(("lp", 2), [{"album": "B"}], False)
+        # The last unit is cut short, as by an interrupted download.
+        os.truncate(journal.file, size + 10)
+        journal = self.journal()
+        self.assertEqual(len(journal), 1)
+        # Units are appended after the last complete one.
+        journal.record(("lp", 2), [{"album": "B"}], True)
+        journal = self.journal()
+        self.assertEqual(len(journal), 2)
+        self.assertEqual(journal[("lp", 2)], ([{"album": "B"}], True))
+
+    def test_other_params(self):
+        journal = self.journal(resume=False)
+        journal.record(("lp", 1), [{"album": "A"}], False)
+        self.assertEqual(len(self.journal(params={"types": ("ep",)})), 0)
+
+    def test_start_over(self):
+        journal = self.journal(resume=False)
+        journal.record(("lp", 1), [{"album": "A"}], False)
+        self.assertEqual(len(self.journal(resume=False)), 0)
+        self.assertEqual(len(self.journal()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+
+from src.get.memo import Memo
+
+
+class MemoTestCase(unittest.TestCase):
+    def test_single_flight(self):
+        memo, calls, started = Memo(), [], Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            sleep(0.2)
+            return "page"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            first = executor.submit(memo.get, "url", compute)
+            started.wait()
+            others = [
+                executor.submit(memo.get, "url", compute) for _ in range(7)
+            ]
+            values = [first.result()] + [f.result() for f in others]
+        self.assertEqual(values, ["page"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(memo.stats()["merged"], 7)
+
+    def test_errors_are_not_kept(self):
+        memo = Memo()
+
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            memo.get("url", fail)
+        self.assertEqual(memo.get("url", lambda: "page"), "page")
+
+    def test_least_recently_used(self):
+        memo = Memo(size=2)
+        memo.get("a", lambda: 1)
+        memo.get("b", lambda: 2)
+        memo.get("a", lambda: 0)
+        memo.get("c", lambda: 3)
+        self.assertEqual(memo.peek("a"), 1)
+        self.assertIsNone(memo.peek("b"))
+        self.assertEqual(memo.stats(), {"hits": 1, "misses": 3, "merged": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
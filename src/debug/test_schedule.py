@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.schedule import Schedule
+
+NOW = datetime(2026, 6, 1)
+
+
+def album(internal_id: int, days: float | None, year: int = 1990) -> dict:
+    return {
+        "internal_id": internal_id,
+        "user_score": 80,
+        "user_ratings": 100,
+        "year": year,
+        "detail_date": None if days is None else NOW - timedelta(days=days),
+    }
+
+
+class ScheduleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.schedule = Schedule("test", directory=Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_plan(self):
+        albums = [
+            album(1, 2),  # Stable and fresh.
+            album(2, 40),  # Stable and stale.
+            album(3, None),  # Without details.
+            album(4, 2, year=NOW.year),  # New, so volatile.
+            album(5, 0.5, year=NOW.year),  # Volatile, but too fresh.
+            album(6, 60),  # Staler.
+        ]
+        self.schedule.observe(albums, now=NOW)
+        self.assertEqual(
+            self.schedule.plan(albums, budget=10, max_age=30, now=NOW),
+            [3, 4, 6, 2],
+        )
+        self.assertEqual(
+            self.schedule.plan(albums, budget=2, max_age=30, now=NOW), [3, 4]
+        )
+
+    def test_volatility(self):
+        albums = [album(1, 2), album(2, 2)]
+        self.schedule.observe(albums, now=NOW - timedelta(days=10))
+        changed = dict(albums[0], user_score=90)
+        self.schedule.observe([changed, albums[1]], now=NOW)
+        self.assertGreater(self.schedule.volatility(1), 0)
+        self.assertEqual(self.schedule.volatility(2), 0)
+        # 10 points in 10 days, half of the last change.
+        self.assertAlmostEqual(self.schedule.volatility(1), 0.5)
+
+    def test_save(self):
+        self.schedule.observe([album(1, 2, year=NOW.year)], now=NOW)
+        self.schedule.save()
+        schedule = Schedule("test", directory=Path(self.tmp.name))
+        self.assertEqual(schedule.albums, self.schedule.albums)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import unittest
+from email.utils import formatdate
+from time import monotonic, time
+
+from src.get.throttle import Throttle, backoff, retry_after
+
+
+class ThrottleTestCase(unittest.TestCase):
+    def test_additive_increase(self):
+        throttle = Throttle("host", ceiling=8)
+        limits = []
+        for _ in range(40):
+            throttle.release(throttle.acquire(), 200)
+            limits.append(throttle.limit)
+        self.assertEqual(limits, sorted(limits))
+        self.assertGreater(throttle.limit, 4)
+        self.assertLessEqual(throttle.limit, 8)
+
+    def test_multiplicative_decrease_once_per_round(self):
+        throttle = Throttle("host", ceiling=8)
+        throttle.limit = 8.0
+        started = [throttle.acquire() for _ in range(4)]
+        for s in started:
+            throttle.release(s, 429)
+        # Requests sent before the first decrease don't decrease it again.
+        self.assertEqual(throttle.limit, 4.0)
+        throttle.release(throttle.acquire(), 503)
+        self.assertEqual(throttle.limit, 2.0)
+        throttle.release(throttle.acquire(), None)
+        throttle.release(throttle.acquire(), None)
+        self.assertEqual(throttle.limit, 1.0)
+
+    def test_slow_responses(self):
+        throttle = Throttle("host", ceiling=8, slow=1)
+        throttle.limit = 8.0
+        throttle.release(throttle.acquire() - 2, 200)
+        self.assertEqual(throttle.limit, 4.0)
+
+    def test_retry_after_pauses(self):
+        throttle = Throttle("host")
+        throttle.release(throttle.acquire(), 429, retry=0.3)
+        start = monotonic()
+        throttle.release(throttle.acquire(), 200)
+        self.assertGreaterEqual(monotonic() - start, 0.25)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after("120"), 120.0)
+        self.assertIsNone(retry_after(None))
+        self.assertIsNone(retry_after("soon"))
+        wait = retry_after(formatdate(time() + 60, usegmt=True))
+        self.assertTrue(55 <= wait <= 60)
+        self.assertEqual(retry_after(formatdate(time() - 60, usegmt=True)), 0)
+
+    def test_backoff(self):
+        for attempt in range(10):
+            wait = backoff(attempt, base=1, ceiling=60)
+            self.assertTrue(0 <= wait <= min(60, 2**attempt))
+
+
+if __name__ == "__main__":
+    unittest.main()
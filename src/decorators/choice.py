@@ -10,7 +10,13 @@ from src.defaults.choice import (
     ALBUM_ID,
     TRACK_ID,
 )
-from src.defaults.download import AOTY_TYPES, PROG_TYPES
+from src.defaults.download import (
+    AOTY_FIELDS,
+    AOTY_TYPES,
+    PARSERS,
+    PROG_FIELDS,
+    PROG_TYPES,
+)
 
 
 def __choice__(
@@ -132,3 +138,38 @@ def key(
         default=default,
         letter=letter,
     )
+
+
+def parser(
+    option: str = "parser",
+    letter: str | None = None,
+    help_message: str = "HTML parser used to read the pages.",
+    all_option: bool = False,
+    default: str | int | tuple = 0,
+):
+    return __choice__(
+        option=option,
+        choices=PARSERS,
+        help_message=help_message,
+        all_option=all_option,
+        default=default,
+        letter=letter,
+    )
+
+
+def fields(
+    option: str = "fields",
+    letter: str | None = None,
+    choices: tuple = tuple(dict.fromkeys(AOTY_FIELDS + PROG_FIELDS)),
+    help_message: str = "Parts of the album pages to download.",
+    all_option: bool = True,
+    default: str | int | tuple = (0,),
+):
+    return __choice__(
+        option=option,
+        choices=choices,
+        help_message=help_message,
+        all_option=all_option,
+        default=default,
+        letter=letter,
+    )
@@ -3,14 +3,34 @@
 from src.decorators import choice, number, groups, data
 from src.decorators.decorators import (
     command,
+    archive,
+    base_url,
+    by_year,
+    cache,
     ceil,
+    coordinator,
+    download_tracks,
+    dry_run,
+    frontier,
     highest_match,
+    incremental,
     use_dedup,
     markdown,
     search,
     name,
+    refresh,
+    resume,
+    serve,
 )
 from src.defaults.choice import ALL_ALBUMS, ALL_TRACKS
+from src.defaults.download import (
+    AOTY_FIELDS,
+    AOTY_PARSER,
+    AOTY_URL,
+    PROG_FIELDS,
+    PROG_PARSER,
+    PROG_URL,
+)
 from src.defaults.defaults import (
     ALBUM_MIN_SCORE,
     ALBUM_MAX_SCORE,
@@ -128,8 +148,29 @@ def download_aoty(func):
         func,
         decorators=(
             choice.aoty(),
+            by_year,
             number.aoty_score(letter="s"),
             number.aoty_score(letter="S", maximum=True),
+            number.concurrency(),
+            number.workers(),
+            number.processes(),
+            cache,
+            refresh,
+            choice.parser(default=AOTY_PARSER),
+            archive,
+            resume,
+            frontier,
+            incremental,
+            number.max_age(),
+            number.budget(),
+            number.max_requests(),
+            number.max_time(),
+            dry_run,
+            download_tracks,
+            choice.fields(choices=AOTY_FIELDS),
+            number.batch_size(),
+            base_url(AOTY_URL),
+            serve,
         ),
         group=groups.download,
         name_="aoty",
@@ -144,12 +185,98 @@ def download_prog(func):
             ceil,
             number.prog_score(letter="s"),
             number.prog_score(letter="S", maximum=True),
+            number.concurrency(),
+            number.workers(),
+            number.processes(),
+            cache,
+            refresh,
+            choice.parser(default=PROG_PARSER),
+            archive,
+            resume,
+            frontier,
+            incremental,
+            number.max_age(),
+            number.budget(),
+            number.max_requests(),
+            number.max_time(),
+            dry_run,
+            download_tracks,
+            choice.fields(choices=PROG_FIELDS),
+            number.batch_size(),
+            base_url(PROG_URL),
+            serve,
         ),
         group=groups.download,
         name_="prog",
     )
 
 
+def download_enrich(func):
+    if len(ALL_ALBUMS) < 1:
+        return func
+    return command(
+        func,
+        decorators=(
+            data.source(letter="d"),
+            choice.fields(default=("tracks",), all_option=False),
+            number.concurrency(),
+            cache,
+            refresh,
+            base_url(None),
+        ),
+        group=groups.download,
+        name_="enrich",
+    )
+
+
+def download_retry_failed(func):
+    if len(ALL_ALBUMS) < 1:
+        return func
+    return command(
+        func,
+        decorators=(
+            data.source(letter="d"),
+            number.concurrency(),
+            cache,
+            refresh,
+        ),
+        group=groups.download,
+        name_="retry-failed",
+    )
+
+
+def download_reparse(func):
+    if len(ALL_ALBUMS) < 1:
+        return func
+    return command(
+        func,
+        decorators=(
+            data.source(letter="d"),
+            number.concurrency(),
+            number.workers(),
+            number.processes(),
+        ),
+        group=groups.download,
+        name_="reparse",
+    )
+
+
+def download_worker(func):
+    return command(
+        func,
+        decorators=(
+            coordinator,
+            number.concurrency(),
+            number.workers(),
+            number.processes(),
+            cache,
+            refresh,
+        ),
+        group=groups.download,
+        name_="worker",
+    )
+
+
 def get(func):
     return command(
         func,
@@ -9,6 +9,13 @@ from click_help_colors import HelpColorsCommand, version_option
 from src.decorators.groups import cli
 from src.defaults import defaults
 from src.defaults.click import CLICK_CONTEXT_SETTINGS
+from src.defaults.download import (
+    ARCHIVE,
+    CACHE,
+    CACHE_REFRESH,
+    FRONTIER,
+    INCREMENTAL,
+)
 
 
 def count_time(func):
@@ -62,6 +69,80 @@ ceil = click.option(
     show_default=True,
     help="Round up (ceil) or down (floor) the score.",
 )
+cache = click.option(
+    "--cache/--no-cache",
+    is_flag=True,
+    type=click.BOOL,
+    default=CACHE,
+    show_default=True,
+    help="Keep downloaded pages on disk and reuse them while fresh.",
+)
+refresh = click.option(
+    "--refresh",
+    is_flag=True,
+    type=click.BOOL,
+    default=CACHE_REFRESH,
+    show_default=True,
+    help="Revalidate every cached page with the website.",
+)
+archive = click.option(
+    "--archive",
+    is_flag=True,
+    type=click.BOOL,
+    default=ARCHIVE,
+    show_default=True,
+    help="Keep every downloaded page, to rebuild the list offline.",
+)
+resume = click.option(
+    "--resume",
+    is_flag=True,
+    type=click.BOOL,
+    default=defaults.RESUME,
+    show_default=True,
+    help="Resume an interrupted download from its journal.",
+)
+frontier = click.option(
+    "--frontier",
+    is_flag=True,
+    type=click.BOOL,
+    default=FRONTIER,
+    show_default=True,
+    help="Download from a queue on disk, shared by the downloads of the list "
+    "running at the same time, and kept until it is done.",
+)
+incremental = click.option(
+    "-i",
+    "--incremental",
+    is_flag=True,
+    type=click.BOOL,
+    default=INCREMENTAL,
+    show_default=True,
+    help="Reuse the album details of the previous list while fresh.",
+)
+by_year = click.option(
+    "--by-year",
+    is_flag=True,
+    type=click.BOOL,
+    default=False,
+    show_default=True,
+    help="Download the list of each release year on its own, and merge them.",
+)
+dry_run = click.option(
+    "--dry-run",
+    is_flag=True,
+    type=click.BOOL,
+    default=False,
+    show_default=True,
+    help="Estimate the requests and time of the download, without it.",
+)
+download_tracks = click.option(
+    "--tracks/--no-tracks",
+    is_flag=True,
+    type=click.BOOL,
+    default=True,
+    show_default=True,
+    help="Download the tracklist of each album.",
+)
 use_dedup = click.option(
     "-d",
     "--dedup/--no-dedup",
@@ -94,6 +175,17 @@ search = click.argument(
     nargs=-1,
     required=False,
 )
+coordinator = click.argument(
+    "coordinator",
+    type=click.STRING,
+)
+serve = click.option(
+    "--serve",
+    type=click.STRING,
+    default=None,
+    help="Hand the download out to workers from HOST:PORT, and save it "
+    "once they are done.",
+)
 name = click.option(
     "-n",
     "--name",
@@ -102,6 +194,16 @@ name = click.option(
 )
 
 
+def base_url(default: str):
+    return click.option(
+        "--base-url",
+        type=click.STRING,
+        default=default,
+        show_default=True,
+        help="Website to download from, e.g. a local test server.",
+    )
+
+
 def __command__(name_: str | None = None):
     return cli.command(
         name=name_,
@@ -299,3 +299,169 @@ def limit_per_column(
         help_message=help_message,
         elements=entries,
     )
+
+
+def concurrency(
+    name: str = "concurrency",
+    default_value: int = src.defaults.download.CONCURRENCY,
+    letter: str | None = "j",
+    option: str | None = "concurrency",
+    help_message: str = "Number of album pages to download concurrently.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def batch_size(
+    name: str = "albums",
+    default_value: int = src.defaults.download.BATCH_SIZE,
+    letter: str | None = None,
+    option: str | None = "batch-size",
+    help_message: str = "Albums kept in memory before writing them to disk.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def processes(
+    name: str = "processes",
+    default_value: int = src.defaults.download.PROCESSES,
+    letter: str | None = "p",
+    option: str | None = "processes",
+    help_message: str = "Number of processes parsing the album pages, or 0 "
+    "to parse them while downloading.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def workers(
+    name: str = "workers",
+    default_value: int = src.defaults.download.WORKERS,
+    letter: str | None = "w",
+    option: str | None = "workers",
+    help_message: str = "Number of album types or genres to download at the "
+    "same time.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def max_age(
+    name: str = "age",
+    default_value: int = src.defaults.download.MAX_AGE,
+    letter: str | None = None,
+    option: str | None = "max-age",
+    help_message: str = "Days before reusable album details are downloaded "
+    "again.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def budget(
+    name: str = "budget",
+    default_value: int = src.defaults.download.BUDGET,
+    letter: str | None = None,
+    option: str | None = "budget",
+    help_message: str = "Album pages refreshed per download, the most "
+    "volatile first, or 0 to refresh them by age.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def max_requests(
+    name: str = "requests",
+    default_value: int = src.defaults.download.MAX_REQUESTS,
+    letter: str | None = None,
+    option: str | None = "max-requests",
+    help_message: str = "Requests before saving the albums downloaded so "
+    "far, or 0 for no limit.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
+
+
+def max_time(
+    name: str = "time",
+    default_value: int = src.defaults.download.MAX_TIME,
+    letter: str | None = None,
+    option: str | None = "max-time",
+    help_message: str = "Seconds before saving the albums downloaded so "
+    "far, or 0 for no limit.",
+):
+    return __number__(
+        name=name,
+        integer=True,
+        default_value=default_value,
+        letter=letter,
+        option=option,
+        show_min_max=False,
+        show_name=True,
+        show_score=False,
+        help_message=help_message,
+    )
@@ -9,6 +9,7 @@ DEBUG = False
 
 INCLUDE_NONE = False
 CEIL = True
+RESUME = False
 DEDUP = True
 ONLY_HIGHEST_MATCH = True
 
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+AOTY_URL = "https://www.albumoftheyear.org"
+PROG_URL = "https://www.progarchives.com"
+
 AOTY_TYPES = ("LP", "EP", "Mixtape", "Compilation", "Live", "Soundtrack")
+AOTY_FIRST_YEAR = 1950  # Of the yearly lists crawled with --by-year.
 PROG_TYPES = {
     "Studio": 1,
     "DVD": 2,
@@ -37,3 +41,54 @@ AOTY_MAX_SCORE = 100
 AOTY_MIN_SCORE = 80
 PROG_MAX_SCORE = 100
 PROG_MIN_SCORE = 80
+
+USER_AGENT = "Mozilla/5.0"
+ACCEPT_ENCODING = "gzip, deflate"
+TIMEOUT = 30
+POOL_SIZE = 8
+HOST_CONCURRENCY = 8  # Requests sent at the same time to a website, at most.
+THROTTLED = (429, 503)  # Statuses of a website asking to slow down.
+SLOW_RESPONSE = 10  # Seconds after which a response counts as throttled.
+RETRIES = 4
+BACKOFF = 1  # Seconds of the first retry, doubled for the next ones.
+BACKOFF_MAX = 60
+MAX_REDIRECTS = 5
+CONCURRENCY = 8
+INCREMENTAL = False
+AOTY_FIELDS = ("details", "tracks")
+PROG_FIELDS = ("details", "score_distribution", "tracks")
+WORKERS = 4  # List types crawled at the same time.
+MERGE_QUEUE = 100  # Albums a list worker crawls ahead of the merge, at most.
+BATCH_SIZE = 500  # Albums kept in memory before writing them to disk.
+MAX_AGE = 30  # Days before the album details are downloaded again.
+BUDGET = 0  # Album pages refreshed per download by volatility, 0 to not.
+MIN_AGE = 1  # Days before the details of volatile albums are refreshed.
+VOLATILE = 1.0  # Score points (or % of ratings) changed per day.
+VOLATILITY_WEIGHT = 0.5  # Of the last change, against the previous ones.
+MAX_REQUESTS = 0  # Requests of a download before saving it as is, 0 for all.
+MAX_TIME = 0  # Seconds of a download before saving it as is, 0 for all.
+AOTY_PER_PAGE = 25  # Albums of every AOTY list page.
+PROG_PER_PAGE = 250  # Albums of every ProgArchives list, at most.
+REQUEST_TIME = 0.5  # Seconds of a request, to estimate the downloads.
+FRONTIER = False  # Crawl from a queue on disk, shared between processes.
+LEASE = 10 * 60  # Seconds a unit is claimed before others can take it.
+POLL = 1  # Seconds between looks for units of other processes.
+
+CACHE = True
+CACHE_REFRESH = False
+ARCHIVE = False  # Keep every fetched page in data/archive.
+CACHE_SIZE = 1024**3  # Bytes of compressed pages kept before evicting.
+CACHE_TTL = (  # Seconds a page is fresh, by the first matching URL pattern.
+    (r"/ratings/|top-prog-albums\.asp", 6 * 60 * 60),  # List pages.
+    (r"/album/|album\.asp", 30 * 24 * 60 * 60),  # Album pages.
+    (r"^https?://[^/]+/?$", 180 * 24 * 60 * 60),  # ProgArchives genre nav.
+    (r"", 24 * 60 * 60),
+)
+MEMO_SIZE = 64  # Parsed pages shared between extractors.
+DETAILS_SIZE = 4096  # Album details shared between lists of a download.
+
+PARSERS = ("html.parser", "lxml", "html5lib")
+PROCESSES = 0  # Processes parsing the pages, or 0 to parse while fetching.
+PARSE_QUEUE = 16  # Downloaded pages waiting for a parsing process, at most.
+AOTY_PARSER = "html.parser"
+PROG_PARSER = "html.parser"
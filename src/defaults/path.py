@@ -8,6 +8,14 @@ SRC = DEFAULTS.parent
 ROOT = SRC.parent
 DATA = ROOT / "data"
 OUTPUT = ROOT / "output"
+CACHE = DATA / "cache"
+JOURNAL = DATA / "journal"
+ARCHIVE = DATA / "archive"
+FAILED = DATA / "failed"
+BATCHES = DATA / "batches"
+SCHEDULE = DATA / "schedule"
+FRONTIER = DATA / "frontier"
+BOUNDARIES = DATA / "boundaries.json"
 
 DEDUP = DATA / "dedup"
 ALBUMS = DATA / "albums"
@@ -33,6 +41,13 @@ TRACKS_OUTPUT = OUTPUT / "tracks"
 ALL_PARENTS = {
     "data": DATA,
     "output": OUTPUT,
+    "cache": CACHE,
+    "journal": JOURNAL,
+    "archive": ARCHIVE,
+    "failed": FAILED,
+    "batches": BATCHES,
+    "schedule": SCHEDULE,
+    "frontier": FRONTIER,
     "dedup": DEDUP,
     "albums": ALBUMS,
     "tracks": TRACKS,
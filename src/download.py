@@ -1,21 +1,97 @@
 #!/usr/bin/env python3
 
-import multiprocessing.dummy as mp
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from textwrap import dedent
+from time import sleep
 
-from src import dump
+import polars as pl
+
+from src import cluster, dump, estimate
+from src.attributes import aoty as aoty_tags, prog as prog_tags
+from src.classes.Album import Album
+from src.classes.AlbumBatches import AlbumBatches
 from src.classes.MusicList import MusicList
+from src.debug import logging
 from src.defaults import defaults
 from src.defaults.download import (
+    AOTY_FIELDS,
     AOTY_TYPES,
     AOTY_MIN_SCORE,
+    AOTY_PARSER,
+    AOTY_URL,
+    ARCHIVE,
+    BATCH_SIZE,
+    BUDGET,
+    CACHE,
+    CACHE_REFRESH,
+    CONCURRENCY,
+    FRONTIER,
+    INCREMENTAL,
+    MAX_AGE,
+    MAX_REQUESTS,
+    MAX_TIME,
+    POLL,
+    PROCESSES,
+    WORKERS,
     AOTY_MAX_SCORE,
+    PROG_FIELDS,
     PROG_TYPES,
     PROG_MIN_SCORE,
     PROG_MAX_SCORE,
+    PROG_PARSER,
+    PROG_URL,
+)
+from src.get import (
+    archive as get_archive,
+    cache as get_cache,
+    connection,
+    data as get_data,
+    engine,
+    limit,
+    memo,
+    pipeline,
 )
-from src.get import data as get_data
+from src.get.file import source
+from src.deadletter import DeadLetters
+from src.frontier import Frontier, owner
+from src.journal import Journal
+from src.schedule import Schedule
+
+
+def __configure__(
+    url: str,
+    parser: str,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    archive: bool = ARCHIVE,
+    offline: bool = False,
+    processes: int = PROCESSES,
+    max_requests: int = MAX_REQUESTS,
+    max_time: float = MAX_TIME,
+    concurrency: int = CONCURRENCY,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    get_data.use_parser(url, parser)
+    connection.configure(debug=debug)
+    engine.configure(concurrency=concurrency)
+    get_cache.configure(enabled=cache, refresh=refresh, debug=debug)
+    get_archive.configure(enabled=archive, offline=offline)
+    pipeline.configure(processes=processes)
+    limit.configure(max_requests=max_requests, max_time=max_time)
+
+
+def __known__(name: str, incremental: bool) -> dict[int, dict] | None:
+    logger = logging.logger(__known__)
+    if not incremental:
+        return None
+    if not source(name, "albums", "download")[3]:
+        logger.warning(f"No previous {name} list found, downloading it all.")
+        return None
+    return {
+        a["internal_id"]: a
+        for a in MusicList().load(name, type_="albums").rows(named=True)
+    }
 
 
 def __download__(
@@ -28,10 +104,25 @@ def __download__(
     max_score: int | float,
     website_name: str | None = None,
     ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    pages=None,
+    fields: tuple = (),
+    resume: bool = defaults.RESUME,
+    frontier: bool = FRONTIER,
+    serve: str | None = None,
+    job: dict | None = None,
+    schema: dict | None = None,
+    batch_size: int = BATCH_SIZE,
+    unique: bool = False,
+    base_url: str | None = None,
+    offline: bool = False,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
-):
+) -> MusicList | None:
+    logger = logging.logger(__download__)
+    memo.clear()
     if verbose:
         print(
             dedent(
@@ -39,7 +130,7 @@ def __download__(
             Download process started:
             - Types: {(
                     type_1 if isinstance(type_1, int) else
-                    tuple(t[0] for t in type_1)
+                    tuple(dict.fromkeys(t[0] for t in type_1))
                     if isinstance(type_1[0], tuple)
                     else type_1
                 )}
@@ -51,6 +142,8 @@ def __download__(
                 )}
             - Minimum score: {min_score}
             - Maximum score: {max_score}
+            - Concurrency: {concurrency}
+            - Workers: {workers}
             """
             )
         )
@@ -59,56 +152,382 @@ def __download__(
             print(f"Downloading lists from {website_name}:")
         else:
             print("Downloading lists:")
-    data = (
-        list()
-    )  # type: list[dict[str, str | int | float | list | dict | timedelta]]
-    until = dump.until(
-        function=function,
-        type1=type_1,
-        type2=type_2,
-        score_key=score_key,
-        min_score=min_score,
-        max_score=max_score,
-        ceil=ceil,
-        quiet=quiet,
-        verbose=verbose,
-        debug=debug,
+    params = {
+        "types": type_1,
+        "types_2": type_2,
+        "score_key": score_key,
+        "min_score": min_score,
+        "max_score": max_score,
+        "ceil": ceil,
+        "fields": fields,
+    }
+    # Coordinated downloads are downloaded from a frontier by the workers.
+    frontier = frontier or serve is not None
+    # Downloads sharing a frontier keep the failures of each other, and
+    # they are retried from the website they were downloaded from.
+    # Pages missing from the archive are kept apart, and the failures of
+    # the download itself are kept to be retried.
+    failed = DeadLetters(
+        f"{name}.offline" if offline else name,
+        params=params | {"base_url": base_url},
+        clear=not (resume or frontier),
     )
-    multithread = False
-    if multithread:
-        with mp.Pool(4) as executor:
-            executor.map(data.append, until)
+    if frontier:
+        queue = Frontier(name, params=params)
+        if len(queue) and not quiet:
+            print(f"Going on from {len(queue)} units already downloaded.")
+        if serve is not None:
+            dump.seed(queue, type_1, type_2)
+            cluster.coordinate(
+                queue,
+                job=(job or {})
+                | {
+                    "name": name,
+                    "type2": type_2,
+                    "score_key": score_key,
+                    "min_score": min_score,
+                    "max_score": max_score,
+                    "ceil": ceil,
+                },
+                address=serve,
+                failed=failed,
+                quiet=quiet,
+            )
+        else:
+            dump.crawl(
+                function=function,
+                frontier=queue,
+                type1=type_1,
+                type2=type_2,
+                score_key=score_key,
+                min_score=min_score,
+                max_score=max_score,
+                ceil=ceil,
+                concurrency=concurrency,
+                workers=workers,
+                pages=pages,
+                failed=failed,
+                quiet=quiet,
+                verbose=verbose,
+                debug=debug,
+            )
+        if not limit.exhausted() and not queue.finish():
+            if not quiet:
+                print(f"{name} is saved by another of its downloads.")
+            pipeline.close()
+            return None
+        until = queue.albums()
     else:
-        for album in until:
-            data.append(album)
-    ml = MusicList(data)
+        journal = Journal(name, params=params, resume=resume)
+        if resume and len(journal) and not quiet:
+            print(f"Resuming from {len(journal)} units already downloaded.")
+        until = dump.until(
+            function=function,
+            type1=type_1,
+            type2=type_2,
+            score_key=score_key,
+            min_score=min_score,
+            max_score=max_score,
+            ceil=ceil,
+            concurrency=concurrency,
+            workers=workers,
+            pages=pages,
+            journal=journal,
+            failed=failed,
+            quiet=quiet,
+            verbose=verbose,
+            debug=debug,
+        )
+    data = AlbumBatches(name, schema=schema, size=batch_size)
+    seen = set()
+    for album in until:
+        if unique:
+            # Shards of a list may share albums, kept once.
+            if album["internal_id"] in seen:
+                continue
+            seen.add(album["internal_id"])
+        data.append(album)
+    stats = connection.stats()
+    cache_stats = get_cache.stats()
+    memo_stats = memo.stats()
+    details_stats = memo.DETAILS.stats()
+    memo.clear()
+    parse_stats = get_data.parse_stats()
+    pipeline_stats = pipeline.stats()
+    pipeline.close()
+    message = (
+        f"{stats['requests']} requests over {stats['connections']} "
+        + f"connections ({stats['reused']} reused, "
+        + f"{stats['compressed']} compressed), "
+        + f"{cache_stats['hits']} cache hits and "
+        + f"{cache_stats['revalidated']} revalidated pages, "
+        + f"{memo_stats['hits'] + memo_stats['merged']} parsed pages and "
+        + f"{details_stats['hits'] + details_stats['merged']} album details "
+        + "reused."
+        + "".join(
+            f" Parsed {t['pages']} pages with {p} in {t['seconds']:.2f} s."
+            for p, t in parse_stats.items()
+        )
+        + (
+            f" Parsed {pipeline_stats['pages']} album pages in parsing "
+            + f"processes, waiting {pipeline_stats['seconds']:.2f} s."
+            if pipeline_stats["pages"]
+            else ""
+        )
+    )
+    if debug:
+        logger.info(
+            message
+            + f" Stats: {stats}, cache: {cache_stats}, memo: {memo_stats},"
+            + f" throttles: {connection.throttles()}"
+        )
+    if verbose:
+        print(message)
+    ml = data.collect()
     ml.save(name)
-    ml.tracks().save()
+    if "tracks" in fields and len(ml):
+        data.tracks().save(name)
+    data.remove()
+    spent = limit.stats()
+    if spent["exhausted"]:
+        # Kept, to go on from the units already downloaded.
+        if not quiet:
+            print(
+                f"Stopped after {spent['requests']} requests and "
+                + f"{spent['seconds']:.0f} s, saving {len(ml)} albums. "
+                + (
+                    "Go on by downloading it again."
+                    if frontier
+                    else "Go on with `--resume`."
+                )
+            )
+    elif frontier:
+        queue.remove()
+    else:
+        journal.remove()
+    if len(failed) and not quiet:
+        print(
+            f"{len(failed)} pages or albums not in the archive, see "
+            + f"`{failed.file}`."
+            if offline
+            else f"{len(failed)} pages or albums failed, see "
+            + f"`{failed.file}`. Retry them with "
+            + "`musiclists download retry-failed`."
+        )
+    return ml
+
+
+def __refresh__(
+    ml: MusicList,
+    details,
+    base_url: str,
+    budget: int,
+    max_age: int = MAX_AGE,
+    fields: tuple = (),
+    schema: dict | None = None,
+    concurrency: int = CONCURRENCY,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+) -> None:
+    albums = [Album(a) for a in ml.rows(named=True)]
+    schedule = Schedule(ml.name)
+    schedule.observe(albums)
+    due = {
+        internal_id: rank
+        for rank, internal_id in enumerate(
+            schedule.plan(albums, budget=budget, max_age=max_age)
+        )
+    }
+    # Albums listed in more than one genre or type are downloaded once,
+    # as `prog_details()` shares them.
+    refreshing = sorted(
+        (a for a in albums if a["internal_id"] in due),
+        key=lambda a: due[a["internal_id"]],
+    )
+    if not quiet:
+        print(
+            f"Refreshing the details of {len(refreshing)} of {len(albums)} "
+            + f"albums of {ml.name}..."
+        )
+    if not refreshing:
+        schedule.save()
+        return
+    failed = DeadLetters(
+        ml.name, params={"score_key": "user_score", "fields": fields}
+    )
+    # Album pages are fresh in the cache for long, so the ones refreshed
+    # are revalidated, as their details are dated when downloaded.
+    get_cache.expire(base_url + a["album_url"] for a in refreshing)
+    memo.clear()
+    engine.run(
+        (
+            partial(
+                dump.try_details,
+                partial(details, a, base_url + a["album_url"], fields=fields),
+                a,
+                base_url + a["album_url"],
+                None,
+                failed,
+            )
+            for a in refreshing
+        ),
+        concurrency=concurrency,
+    )
+    memo.clear()
+    pipeline.close()
+    if verbose:
+        for a in refreshing:
+            print(f"   {a}")
+    __save__(ml, [a.data for a in albums], schema)
+    schedule.save()
 
 
 def aoty(
     field: str = "aoty",
     types: tuple = AOTY_TYPES,
+    years: tuple | None = None,
     start_page: int = 1,
     min_score: int = AOTY_MIN_SCORE,
     max_score: int = AOTY_MAX_SCORE,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    processes: int = PROCESSES,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    parser: str = AOTY_PARSER,
+    archive: bool = ARCHIVE,
+    offline: bool = False,
+    resume: bool = defaults.RESUME,
+    frontier: bool = FRONTIER,
+    incremental: bool = INCREMENTAL,
+    max_age: int = MAX_AGE,
+    budget: int = BUDGET,
+    max_requests: int = MAX_REQUESTS,
+    max_time: float = MAX_TIME,
+    dry_run: bool = False,
+    fields: tuple = AOTY_FIELDS,
+    batch_size: int = BATCH_SIZE,
+    base_url: str = AOTY_URL,
+    serve: str | None = None,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
 ):
-    __download__(
+    logger = logging.logger(aoty)
+    if serve is not None and (incremental or budget):
+        logger.warning(
+            "Workers download every album page, without --incremental or "
+            + "--budget."
+        )
+        incremental, budget = False, 0
+    base_url = base_url.rstrip("/")
+    __configure__(
+        base_url,
+        parser=parser,
+        cache=cache,
+        refresh=refresh,
+        archive=archive,
+        offline=offline,
+        processes=processes,
+        max_requests=max_requests,
+        max_time=max_time,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    if dry_run:
+        print(
+            estimate.report(
+                field,
+                estimate.aoty(
+                    types=(
+                        tuple((t, y) for t in types for y in years)
+                        if years
+                        else types
+                    ),
+                    start_page=start_page,
+                    min_score=min_score,
+                    max_score=max_score,
+                    base_url=base_url,
+                    fields=fields,
+                    concurrency=concurrency,
+                ),
+            )
+        )
+        return
+    if archive:
+        get_archive.STORE.remember(
+            field,
+            {
+                "types": types,
+                "years": years,
+                "start_page": start_page,
+                "min_score": min_score,
+                "max_score": max_score,
+                "fields": fields,
+                "base_url": base_url,
+            },
+        )
+    known = __known__(field, incremental or budget > 0)
+    # With a budget, the lists are downloaded keeping every known album as
+    # is, and then only the album pages due are refreshed (and, on a first
+    # download, the schedule is started).
+    scheduled = budget > 0 and known is not None
+    ml = __download__(
         name=field,
-        function=dump.aoty,
-        type_1=types,
+        function=partial(
+            dump.aoty,
+            base_page=base_url,
+            known=known,
+            max_age=None if scheduled else max_age,
+            fields=() if scheduled else fields,
+        ),
+        # With years, every type and year is a list of its own.
+        type_1=tuple((t, y) for t in types for y in years) if years else types,
         type_2=start_page,
         score_key="user_score",
         min_score=min_score,
         max_score=max_score,
         website_name="AOTY",
+        pages=partial(
+            dump.aoty_last_page,
+            base_page=base_url,
+            quiet=quiet,
+            debug=debug,
+        ),
+        fields=fields,
+        concurrency=concurrency,
+        workers=workers,
+        resume=resume,
+        frontier=frontier,
+        serve=serve,
+        job={
+            "site": "aoty",
+            "base_url": base_url,
+            "parser": parser,
+            "fields": () if scheduled else fields,
+        },
+        schema=aoty_tags.schema,
+        batch_size=batch_size,
+        unique=bool(years),
+        base_url=base_url,
+        offline=offline,
         quiet=quiet,
         verbose=verbose,
         debug=debug,
     )
+    if budget > 0 and ml is not None:
+        __refresh__(
+            ml,
+            details=partial(dump.aoty_details, debug=debug),
+            base_url=base_url,
+            budget=budget,
+            max_age=max_age,
+            fields=fields,
+            schema=aoty_tags.schema,
+            concurrency=concurrency,
+            quiet=quiet,
+            verbose=verbose,
+        )
 
 
 def prog(
@@ -117,22 +536,493 @@ def prog(
     min_score: float = PROG_MIN_SCORE,
     max_score: float = PROG_MAX_SCORE,
     ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    processes: int = PROCESSES,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    parser: str = PROG_PARSER,
+    archive: bool = ARCHIVE,
+    offline: bool = False,
+    resume: bool = defaults.RESUME,
+    frontier: bool = FRONTIER,
+    incremental: bool = INCREMENTAL,
+    max_age: int = MAX_AGE,
+    budget: int = BUDGET,
+    max_requests: int = MAX_REQUESTS,
+    max_time: float = MAX_TIME,
+    dry_run: bool = False,
+    fields: tuple = PROG_FIELDS,
+    batch_size: int = BATCH_SIZE,
+    base_url: str = PROG_URL,
+    serve: str | None = None,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
 ):
+    logger = logging.logger(prog)
+    if serve is not None and (incremental or budget):
+        logger.warning(
+            "Workers download every album page, without --incremental or "
+            + "--budget."
+        )
+        incremental, budget = False, 0
+    base_url = base_url.rstrip("/")
+    __configure__(
+        base_url,
+        parser=parser,
+        cache=cache,
+        refresh=refresh,
+        archive=archive,
+        offline=offline,
+        processes=processes,
+        max_requests=max_requests,
+        max_time=max_time,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    if dry_run:
+        genres, downloaded = estimate.prog_genres(base_url=base_url)
+        print(
+            estimate.report(
+                field,
+                estimate.prog(
+                    genres=genres,
+                    types=tuple((t, PROG_TYPES[t]) for t in types),
+                    min_score=min_score,
+                    max_score=max_score,
+                    ceil=ceil,
+                    base_url=base_url,
+                    fields=fields,
+                    downloaded=int(downloaded),
+                    concurrency=concurrency,
+                ),
+            )
+        )
+        return
+    if archive:
+        get_archive.STORE.remember(
+            field,
+            {
+                "types": types,
+                "min_score": min_score,
+                "max_score": max_score,
+                "ceil": ceil,
+                "fields": fields,
+                "base_url": base_url,
+            },
+        )
+    known = __known__(field, incremental or budget > 0)
+    scheduled = budget > 0 and known is not None
     if not quiet:
         print("Generating list of genres...")
-    __download__(
+    ml = __download__(
         name=field,
-        function=dump.prog,
-        type_1=tuple(get_data.prog_genres().items()),
+        function=partial(
+            dump.prog,
+            base_page=base_url + "/",
+            known=known,
+            max_age=None if scheduled else max_age,
+            fields=() if scheduled else fields,
+        ),
+        type_1=tuple(get_data.prog_genres(prog_url=base_url).items()),
         type_2=tuple((t, PROG_TYPES[t]) for t in types),
         score_key="user_score",
         min_score=min_score,
         max_score=max_score,
         website_name="Progarchives",
         ceil=ceil,
+        fields=fields,
+        concurrency=concurrency,
+        workers=workers,
+        resume=resume,
+        frontier=frontier,
+        serve=serve,
+        job={
+            "site": "prog",
+            "base_url": base_url,
+            "parser": parser,
+            "fields": () if scheduled else fields,
+        },
+        schema=prog_tags.schema,
+        batch_size=batch_size,
+        base_url=base_url,
+        offline=offline,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+    if budget > 0 and ml is not None:
+        __refresh__(
+            ml,
+            details=dump.prog_details,
+            base_url=base_url + "/",
+            budget=budget,
+            max_age=max_age,
+            fields=fields,
+            schema=prog_tags.schema,
+            concurrency=concurrency,
+            quiet=quiet,
+            verbose=verbose,
+        )
+
+
+def worker(
+    coordinator: str,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    processes: int = PROCESSES,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+):
+    logger = logging.logger(worker)
+    try:
+        job = cluster.call(coordinator, "/job")
+    except OSError as e:
+        logger.error(f"Coordinator {coordinator} can't be reached ({e!r}).")
+        exit(1)
+    base_url, fields = job["base_url"], job["fields"]
+    __configure__(
+        base_url,
+        parser=job["parser"],
+        cache=cache,
+        refresh=refresh,
+        processes=processes,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    if job["site"] == "aoty":
+        function = partial(dump.aoty, base_page=base_url, fields=fields)
+        pages = partial(
+            dump.aoty_last_page, base_page=base_url, quiet=quiet, debug=debug
+        )
+    else:
+        function = partial(dump.prog, base_page=base_url + "/", fields=fields)
+        pages = None
+    if not quiet:
+        print(f"Downloading {job['name']} for {coordinator}...")
+
+    def run() -> int:
+        units = 0
+        while True:
+            try:
+                claimed = cluster.call(
+                    coordinator, "/claim", {"worker": owner()}
+                )
+                unit = claimed["unit"]
+                if unit is None:
+                    if not claimed["busy"]:
+                        return units
+                    # Units claimed by others may still add the next pages.
+                    sleep(POLL)
+                    continue
+                failed = cluster.Failures()
+                result = dump.work(
+                    function,
+                    unit,
+                    type2=job["type2"],
+                    score_key=job["score_key"],
+                    min_score=job["min_score"],
+                    max_score=job["max_score"],
+                    ceil=job["ceil"],
+                    concurrency=concurrency,
+                    pages=pages,
+                    failed=failed,
+                    quiet=quiet,
+                    verbose=verbose,
+                    debug=debug,
+                )
+                cluster.call(
+                    coordinator,
+                    "/done",
+                    {"unit": unit, "result": result, "failed": failed},
+                )
+            except OSError as e:
+                # The coordinator is gone: done, or stopped.
+                if debug:
+                    logger.info(f"Coordinator {coordinator} is gone ({e!r}).")
+                return units
+            units += 1
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        done = sum(executor.map(lambda _: run(), range(max(1, workers))))
+    pipeline.close()
+    memo.clear()
+    if not quiet:
+        print(f"Downloaded {done} units of {job['name']}.")
+
+
+def enrich(
+    data: str,
+    fields: tuple = ("tracks",),
+    concurrency: int = CONCURRENCY,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    base_url: str | None = None,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+):
+    ml = MusicList().load(data, type_="albums")
+    base_page, _, site_fields, schema = __site__(
+        ml,
+        data,
+        base_url=base_url,
+        cache=cache,
+        refresh=refresh,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    fields = tuple(f for f in fields if f in site_fields)
+    albums = [Album(a) for a in ml.rows(named=True)]
+    missing = [
+        a
+        for a in albums
+        if "details" in fields or any(not a.get(f) for f in fields)
+    ]
+    if not quiet:
+        print(f"Enriching {len(missing)} of {len(albums)} albums of {data}...")
+    # Albums failing are kept as they were, to retry them with
+    # `retry-failed`.
+    failed = DeadLetters(
+        ml.name,
+        params={
+            "score_key": "user_score",
+            "fields": fields,
+            "base_url": base_page.rstrip("/"),
+        },
+    )
+    errors = len(failed)
+    done = engine.run(
+        (
+            partial(
+                dump.try_details,
+                (
+                    partial(
+                        dump.aoty_album,
+                        a,
+                        base_page + a["album_url"],
+                        fields=fields,
+                        debug=debug,
+                    )
+                    if ml.name == "aoty"
+                    else partial(
+                        dump.prog_album,
+                        a,
+                        base_page + a["album_url"],
+                        fields=fields,
+                    )
+                ),
+                a,
+                base_page + a["album_url"],
+                None,
+                failed,
+            )
+            for a in missing
+        ),
+        concurrency=concurrency,
+    )
+    if verbose:
+        for a, ok in zip(missing, done):
+            if ok:
+                print(f"   {a}")
+    __save__(ml, [a.data for a in albums], schema)
+    if not quiet and len(failed) > errors:
+        print(
+            f"{len(failed) - errors} albums failed, see `{failed.file}`. "
+            + "Retry them with `musiclists download retry-failed`."
+        )
+
+
+def __base_page__(name: str, base_url: str) -> str:
+    # Album URLs of ProgArchives are relative to its root.
+    return base_url.rstrip("/") + ("/" if name == "prog" else "")
+
+
+def __site__(
+    ml: MusicList,
+    data: str,
+    base_url: str | None = None,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    concurrency: int = CONCURRENCY,
+    debug: bool = defaults.DEBUG,
+) -> tuple[str, str, tuple, dict]:
+    logger = logging.logger(__site__)
+    sites = {
+        "aoty": (AOTY_URL, AOTY_PARSER, AOTY_FIELDS, aoty_tags.schema),
+        "prog": (PROG_URL, PROG_PARSER, PROG_FIELDS, prog_tags.schema),
+    }
+    if ml.name not in sites or "album_url" not in ml.columns:
+        logger.error(
+            f"{data} list has no album URLs from a known website "
+            + f"({', '.join(sites)}), so it cannot be updated."
+        )
+        exit(1)
+    url, parser, fields, schema = sites[ml.name]
+    base_page = __base_page__(ml.name, base_url or url)
+    __configure__(
+        base_page,
+        parser=parser,
+        cache=cache,
+        refresh=refresh,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    return base_page, parser, fields, schema
+
+
+def __save__(ml: MusicList, albums: list[dict], schema: dict) -> None:
+    updated = MusicList(
+        pl.DataFrame(
+            albums,
+            schema_overrides=schema,
+            infer_schema_length=None,
+        )
+    ).get_attrs(ml)
+    updated.save()
+    if "tracks" in updated.columns:
+        updated.tracks().save()
+
+
+def retry_failed(
+    data: str,
+    concurrency: int = CONCURRENCY,
+    cache: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+):
+    ml = MusicList().load(data, type_="albums")
+    _, parser, _, schema = __site__(
+        ml,
+        data,
+        cache=cache,
+        refresh=refresh,
+        concurrency=concurrency,
+        debug=debug,
+    )
+    failed = DeadLetters(ml.name)
+    entries = list(failed)
+    if not entries:
+        if not quiet:
+            print(f"No failed pages or albums of {ml.name}.")
+        return
+    if not quiet:
+        print(f"Retrying {len(entries)} failed pages and albums...")
+    # Entries failing again are recorded anew, along with their params.
+    failed.replace([])
+    albums = []
+    for e in entries:
+        failed.params = e["params"]
+        params = e["params"]
+        # Lists downloaded from another website (as a test server) are
+        # retried from it.
+        base_page = __base_page__(
+            ml.name,
+            params.get("base_url")
+            or (AOTY_URL if ml.name == "aoty" else PROG_URL),
+        )
+        get_data.use_parser(base_page, parser)
+        function = partial(
+            dump.aoty if ml.name == "aoty" else dump.prog,
+            base_page=base_page,
+            fields=params["fields"],
+        )
+        if e["album"] is None:
+            a, b = e["unit"]
+            albums += dump.until(
+                function=function,
+                type1=(a,),
+                # A list without a known end stopped at the failed page,
+                # so the pages after it are downloaded too.
+                type2=b if e.get("rest") else (b,),
+                score_key=params["score_key"],
+                min_score=params["min_score"],
+                max_score=params["max_score"],
+                ceil=params["ceil"],
+                concurrency=concurrency,
+                failed=failed,
+                quiet=quiet,
+                verbose=verbose,
+                debug=debug,
+            )
+            continue
+        album = Album(e["album"])
+        detail = partial(
+            dump.aoty_album if ml.name == "aoty" else dump.prog_album,
+            album,
+            e["url"],
+            fields=params["fields"],
+        )
+        if not dump.try_details(
+            detail, album, e["url"], e["unit"], failed
+        ):
+            continue
+        album.compute_id()
+        if not album.get(params["score_key"]):
+            failed.record(
+                e["url"],
+                f"Score with key {params['score_key']}, not found.",
+                album=album,
+                unit=e["unit"],
+            )
+            continue
+        if verbose:
+            print(f"   {album}")
+        albums.append(album.data)
+    if not quiet:
+        print(
+            f"Recovered {len(albums)} albums, {len(failed)} entries failed "
+            + "again."
+        )
+    if not albums:
+        return
+    recovered = {a["internal_id"] for a in albums}
+    __save__(
+        ml,
+        [
+            a
+            for a in ml.rows(named=True)
+            if a["internal_id"] not in recovered
+        ]
+        + albums,
+        schema,
+    )
+
+
+def reparse(
+    data: str,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    processes: int = PROCESSES,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+):
+    logger = logging.logger(reparse)
+    name = data.split(".")[0]
+    params = get_archive.STORE.params(name)
+    if name not in ("aoty", "prog") or params is None:
+        logger.error(
+            f"{name} list wasn't downloaded with --archive, so it cannot be "
+            + "rebuilt from the archive."
+        )
+        exit(1)
+    if not quiet:
+        print(f"Rebuilding {name} from the archived pages...")
+    (aoty if name == "aoty" else prog)(
+        field=name,
+        **params,
+        concurrency=concurrency,
+        workers=workers,
+        processes=processes,
+        cache=False,
+        offline=True,
         quiet=quiet,
         verbose=verbose,
         debug=debug,
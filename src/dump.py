@@ -3,16 +3,280 @@
 import math
 import pprint
 from collections.abc import Iterator
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
 from itertools import count
 from pathlib import Path
+from queue import Full, Queue
+from threading import Event
+from time import sleep
 
+from src import boundary
 from src.attributes import aoty as aoty_tags, prog as prog_tags
 from src.classes.Album import Album
 from src.debug import logging
 from src.defaults import defaults
-from src.get import data as get_data, file as get_file
+from src.defaults.download import (
+    AOTY_FIELDS,
+    AOTY_URL,
+    CONCURRENCY,
+    MAX_AGE,
+    MERGE_QUEUE,
+    POLL,
+    PROG_FIELDS,
+    PROG_URL,
+    WORKERS,
+)
+from src.get import (
+    cache,
+    data as get_data,
+    engine,
+    file as get_file,
+    limit,
+    memo,
+    pipeline,
+)
 from src.get.file import contains_dirs
+from src.deadletter import DeadLetters
+from src.frontier import Frontier
+from src.journal import Journal
+
+
+def __unit__(function, a, b, **kwargs) -> list | Exception | None:
+    if limit.exhausted():
+        return None
+    try:
+        return list(function(a, b, **kwargs))
+    except Exception as e:
+        return e
+
+
+def try_details(
+    job,
+    album: Album,
+    album_url: str,
+    unit: tuple,
+    failed: DeadLetters | None = None,
+) -> bool:
+    if limit.exhausted():
+        return False
+    try:
+        job()
+    except Exception as e:
+        if failed is None:
+            raise
+        failed.record(album_url, e, album=album, unit=unit)
+        return False
+    return True
+
+
+def __select__(
+    unit,
+    key: tuple,
+    score_key: str,
+    min_score: int | float,
+    max_score: int | float,
+    failed: DeadLetters | None = None,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+) -> tuple[list[dict], bool, int]:
+    """
+    Albums of a unit between the scores, whether the unit reached
+    `min_score`, and how many albums the unit had.
+    """
+    logger = logging.logger(__select__)
+    albums = []
+    found_limit = False
+    seen = 0
+    for album in unit:
+        seen += 1
+        if not isinstance(album, Album):
+            album = Album(album)
+        album.compute_id()
+        score = album.get(score_key)
+        if not score:
+            message = f"Score with key {score_key}, not found for:\n{album}"
+            if failed is None:
+                logger.error(message)
+                exit(1)
+            failed.record(
+                str(album.get("album_url")),
+                message,
+                album=album,
+                unit=key,
+            )
+            continue
+        if score < min_score:
+            if debug:
+                logger.info(
+                    f"Found lower score ({score}) than limit for:\n"
+                    + str(album)
+                )
+            found_limit = True
+            break
+        if min_score <= score <= max_score:
+            if verbose:
+                print(f"   {score}: {album}")
+            albums.append(album.data)
+    return albums, found_limit, seen
+
+
+def __until__(
+    function,
+    type1,
+    type2: list | tuple | int,
+    score_key: str,
+    min_score: int | float,
+    max_score: int | float,
+    ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    pages=None,
+    journal: Journal | None = None,
+    failed: DeadLetters | None = None,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+) -> Iterator[dict[str, str | int | float | list | dict | timedelta]]:
+    logger = logging.logger(__until__)
+    a = type1
+    units = count(type2) if isinstance(type2, int) else type2
+    prefetched = None
+    last = None
+    if pages and isinstance(type2, int) and not limit.exhausted():
+        try:
+            last = pages(a, type2, min_score)
+        except Exception as e:
+            if failed is None:
+                raise
+            logger.warning(
+                f"Couldn't find the last page of {a} ({e!r}), "
+                + "going page by page."
+            )
+    if last is not None:
+        # The pages up to the score boundary are known to be needed (and
+        # the next one is known not to be), so they are downloaded ahead
+        # of going through them, up to `concurrency` pages at a time.
+        units = range(type2, last + 1)
+        todo = tuple(
+            b for b in units if journal is None or (a, b) not in journal
+        )
+        if debug:
+            logger.info(f"Prefetching {a}, pages {todo}.")
+        prefetch = partial(
+            __unit__,
+            function,
+            a,
+            min_score=min_score,
+            max_score=max_score,
+            ceil=ceil,
+            concurrency=concurrency,
+            failed=failed,
+            quiet=quiet,
+            verbose=verbose,
+            debug=debug,
+        )
+        prefetched = engine.stream(
+            (partial(prefetch, b) for b in todo), concurrency=concurrency
+        )
+    try:
+        for b in units:
+            if journal is not None and (a, b) in journal:
+                albums, found_limit = journal[(a, b)]
+                if debug:
+                    logger.info(f"Resuming {a}, {b} from journal.")
+                yield from albums
+                if found_limit:
+                    break
+                continue
+            # Every page not in the journal is prefetched, in order.
+            unit = next(prefetched) if prefetched is not None else None
+            if unit is None and limit.exhausted():
+                if debug:
+                    logger.info(f"Out of requests or time, stopping {a}.")
+                break
+            try:
+                if unit is None:
+                    unit = function(
+                        a,
+                        b,
+                        min_score=min_score,
+                        max_score=max_score,
+                        ceil=ceil,
+                        concurrency=concurrency,
+                        failed=failed,
+                        quiet=quiet,
+                        verbose=verbose,
+                        debug=debug,
+                    )
+                if isinstance(unit, Exception):
+                    raise unit
+                albums, found_limit, seen = __select__(
+                    unit,
+                    (a, b),
+                    score_key=score_key,
+                    min_score=min_score,
+                    max_score=max_score,
+                    failed=failed,
+                    verbose=verbose,
+                    debug=debug,
+                )
+                yield from albums
+            except Exception as e:
+                if failed is None:
+                    raise
+                # Without a known end, pages can't be skipped past a
+                # failure.
+                failed.record(
+                    getattr(e, "url", None) or f"{a}, {b}",
+                    e,
+                    unit=(a, b),
+                    rest=isinstance(units, count),
+                )
+                if isinstance(units, count):
+                    break
+                continue
+            if not seen and isinstance(type2, int):
+                if debug:
+                    logger.info(f"No albums in {a}, page {b}, stopping.")
+                found_limit = True
+            if limit.exhausted():
+                # Albums of the page may be missing, so it isn't journaled.
+                break
+            if journal is not None:
+                journal.record((a, b), albums, found_limit)
+            if found_limit:
+                break
+    finally:
+        if prefetched is not None:
+            # The pages after the end found aren't downloaded.
+            prefetched.close()
+
+DONE = object()  # End of the albums of a job of `until()`.
+
+
+def __feed__(job, queue: Queue, stop: Event) -> None:
+    # In a worker of `until()`: the albums of `job` (then DONE, or the
+    # error that stopped it) go to `queue`, until the merge is stopped.
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=POLL)
+                return True
+            except Full:
+                continue
+        return False
+
+    if stop.is_set():
+        return
+    try:
+        for album in job():
+            if not put(album):
+                return
+    except Exception as e:
+        put(e)
+        return
+    put(DONE)
 
 
 def until(
@@ -23,73 +287,481 @@ def until(
     min_score: int | float,
     max_score: int | float,
     ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    queue: int = MERGE_QUEUE,
+    pages=None,
+    journal: Journal | None = None,
+    failed: DeadLetters | None = None,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
 ) -> Iterator[dict[str, str | int | float | list | dict | timedelta]]:
-    logger = logging.logger(until)
-    for a in type1:
-        found_limit = False
-        iter_type = count(type2) if isinstance(type2, int) else iter(type2)
-        while not found_limit:
-            b = next(iter_type)
-            for album in function(
+    crawl = partial(
+        __until__,
+        function,
+        type2=type2,
+        score_key=score_key,
+        min_score=min_score,
+        max_score=max_score,
+        ceil=ceil,
+        concurrency=concurrency,
+        pages=pages,
+        journal=journal,
+        failed=failed,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+    if isinstance(type2, int):
+        jobs = tuple(partial(crawl, a) for a in type1)
+    else:
+        # Every combination (as every genre and type of ProgArchives) is a
+        # list of its own, sorted and cut by score independently.
+        jobs = tuple(
+            partial(crawl, a, type2=(b,)) for a in type1 for b in type2
+        )
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield from job()
+        return
+    # Each job has its own pages and stop condition, so they are crawled
+    # by separate workers and merged back in their original order, through
+    # a bounded queue per job: workers ahead of the merge wait for it.
+    stop = Event()
+    queues = tuple(Queue(maxsize=max(1, queue)) for _ in jobs)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for job, q in zip(jobs, queues):
+            executor.submit(__feed__, job, q, stop)
+        try:
+            for q in queues:
+                while True:
+                    album = q.get()
+                    if album is DONE:
+                        break
+                    if isinstance(album, Exception):
+                        raise album
+                    yield album
+        finally:
+            stop.set()
+
+
+def __last__(
+    a,
+    type2: int,
+    min_score: int | float,
+    pages=None,
+    failed: DeadLetters | None = None,
+) -> int | None:
+    logger = logging.logger(__last__)
+    if not pages:
+        return None
+    try:
+        return pages(a, type2, min_score)
+    except Exception as e:
+        if failed is None:
+            raise
+        logger.warning(
+            f"Couldn't find the last page of {a} ({e!r}), "
+            + "going page by page."
+        )
+        return None
+
+
+def work(
+    function,
+    unit: dict,
+    type2: list | tuple | int,
+    score_key: str,
+    min_score: int | float,
+    max_score: int | float,
+    ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    pages=None,
+    failed=None,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+) -> dict:
+    """
+    Download a unit of a frontier: the last page of a list (`b` is None),
+    or the albums of a page and whether it reached `min_score`.
+    """
+    a, b = unit["a"], unit["b"]
+    if b is None:
+        return {"last": __last__(a, type2, min_score, pages, failed)}
+    try:
+        albums, found_limit, seen = __select__(
+            function(
                 a,
                 b,
+                min_score=min_score,
+                max_score=max_score,
                 ceil=ceil,
+                concurrency=concurrency,
+                failed=failed,
                 quiet=quiet,
                 verbose=verbose,
                 debug=debug,
-            ):
-                album = Album(album)
-                album.compute_id()
-                score = album.get(score_key)
-                if not score:
-                    logger.error(
-                        f"Score with key {score_key}, not found for:\n{album}"
-                    )
-                    exit(1)
-                if score < min_score:
-                    if debug:
-                        logger.info(
-                            f"Found lower score ({score}) than limit for:\n{album}"
-                        )
-                    found_limit = True
-                    break
-                if min_score <= score <= max_score:
-                    if verbose:
-                        print(f"   {score}: {album}")
-                    yield dict(album)
+            ),
+            (a, b),
+            score_key=score_key,
+            min_score=min_score,
+            max_score=max_score,
+            failed=failed,
+            verbose=verbose,
+            debug=debug,
+        )
+    except Exception as e:
+        if failed is None:
+            raise
+        # Without a known end, pages can't be skipped past a failure.
+        rest = isinstance(type2, int) and not unit["bounded"]
+        failed.record(
+            getattr(e, "url", None) or f"{a}, {b}", e, unit=(a, b), rest=rest
+        )
+        return {"albums": [], "found_limit": rest}
+    if not seen and isinstance(type2, int):
+        found_limit = True
+    return {"albums": albums, "found_limit": found_limit}
+
+
+def settle(
+    frontier: Frontier,
+    unit: dict,
+    result: dict,
+    type2: list | tuple | int,
+) -> None:
+    # Records the result of `work()`, adding the units coming after it: the
+    # pages of a list up to its last page when found (or the first one, to
+    # go on page by page), or the next page of a list without a known end.
+    a, b, shard = unit["a"], unit["b"], unit["shard"]
+    if b is None:
+        last = result["last"]
+        frontier.add(
+            ((a, type2, shard, type2, type2, False),)
+            if last is None
+            else ((a, p, shard, p, p, True) for p in range(type2, last + 1))
+        )
+        frontier.done(a, b, [], False)
+        return
+    frontier.done(a, b, result["albums"], result["found_limit"])
+    if isinstance(type2, int) and not unit["bounded"]:
+        if not result["found_limit"]:
+            frontier.add(((a, b + 1, shard, b + 1, b + 1, False),))
+
+
+def __crawl__(
+    function,
+    frontier: Frontier,
+    type2: list | tuple | int,
+    score_key: str,
+    min_score: int | float,
+    max_score: int | float,
+    ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    pages=None,
+    failed: DeadLetters | None = None,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    logger = logging.logger(__crawl__)
+    while not limit.exhausted():
+        unit = frontier.claim()
+        if unit is None:
+            if not frontier.busy():
+                return
+            # Units claimed by others may still add the next pages.
+            sleep(POLL)
+            continue
+        if debug and unit["attempts"] > 1:
+            logger.info(
+                f"Claiming {unit['a']}, {unit['b']} again "
+                + f"({unit['attempts']})."
+            )
+        result = work(
+            function,
+            unit,
+            type2=type2,
+            score_key=score_key,
+            min_score=min_score,
+            max_score=max_score,
+            ceil=ceil,
+            concurrency=concurrency,
+            pages=pages,
+            failed=failed,
+            quiet=quiet,
+            verbose=verbose,
+            debug=debug,
+        )
+        if unit["b"] is not None and limit.exhausted():
+            # Albums of the page may be missing, so it is left to others.
+            frontier.release(unit["a"], unit["b"])
+            return
+        settle(frontier, unit, result, type2)
+
+
+def seed(
+    frontier: Frontier,
+    type1: list | tuple,
+    type2: list | tuple | int,
+) -> None:
+    # As in `until()`, every combination of `type1` and `type2` is a list
+    # of its own, or with pages as `type2`, every `type1` is a list whose
+    # pages are searched first, in a unit of its own.
+    if isinstance(type2, int):
+        frontier.add((a, None, i, -1, -1, False) for i, a in enumerate(type1))
+    else:
+        frontier.add(
+            (a, b, i * len(type2) + j, 0, 0, True)
+            for i, a in enumerate(type1)
+            for j, b in enumerate(type2)
+        )
+
+
+def crawl(
+    function,
+    frontier: Frontier,
+    type1: list | tuple,
+    type2: list | tuple | int,
+    score_key: str,
+    min_score: int | float,
+    max_score: int | float,
+    ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    workers: int = WORKERS,
+    pages=None,
+    failed: DeadLetters | None = None,
+    quiet: bool = defaults.QUIET,
+    verbose: bool = defaults.VERBOSE,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    """
+    Download the units of `frontier` with `workers` threads, until none
+    is left (in this or any other process downloading the same list).
+    """
+    seed(frontier, type1, type2)
+    job = partial(
+        __crawl__,
+        function,
+        frontier,
+        type2=type2,
+        score_key=score_key,
+        min_score=min_score,
+        max_score=max_score,
+        ceil=ceil,
+        concurrency=concurrency,
+        pages=pages,
+        failed=failed,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+    if workers <= 1:
+        job()
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(job) for _ in range(workers)]:
+            future.result()
+
+
+def reuse(
+    album: Album,
+    album_url: str,
+    known: dict[int, dict] | None,
+    max_age: int | None = MAX_AGE,
+) -> Album | None:
+    if not known or album["internal_id"] not in known:
+        return None
+    old = known[album["internal_id"]]
+    fetched = old.get("detail_date")
+    if max_age is not None and (
+        not fetched or datetime.now() - fetched > timedelta(days=max_age)
+    ):
+        # Details too old are downloaded again, not read from the cache.
+        cache.expire((album_url,))
+        return None
+    return Album(old | dict(album))
+
+
+def aoty_album(
+    album: Album,
+    album_url: str,
+    album_tags: dict = aoty_tags.album,
+    fields: tuple = AOTY_FIELDS,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    if "details" in fields:
+        album_data = get_data.table(
+            url=album_url,
+            id="centerContent",
+            strainer=aoty_tags.album_page,
+            debug=debug,
+        )
+        get_data.data(element=album_data, data_struct=album, tags=album_tags)
+    if "tracks" in fields:
+        album["tracks"], album["total_length"] = get_data.aoty_tracks(
+            url=album_url,
+            debug=debug,
+        )
+        if not album["total_length"]:
+            del album["total_length"]
+    album["detail_date"] = datetime.now()
+
+
+def __details__(
+    function,
+    album_url: str,
+    album_tags: dict,
+    fields: tuple,
+) -> dict:
+    details = Album()
+    function(details, album_url, album_tags, fields)
+    return details.data
+
+
+def aoty_details(
+    album: Album,
+    album_url: str,
+    album_tags: dict = aoty_tags.album,
+    fields: tuple = AOTY_FIELDS,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    if not pipeline.enabled():
+        aoty_album(album, album_url, album_tags, fields, debug)
+        return
+    album.update(
+        pipeline.parse(
+            partial(
+                __details__,
+                partial(aoty_album, debug=debug),
+                album_url,
+                album_tags,
+                fields,
+            ),
+            album_url,
+        )
+    )
+
+
+def aoty_shard(album_type: str | tuple[str, int]) -> tuple[str, str]:
+    # An album type, or an album type and a release year (a shard of the
+    # list of the type, crawled on its own).
+    if isinstance(album_type, tuple):
+        return album_type[0], str(album_type[1])
+    return album_type, "all"
+
+
+def aoty_scores(
+    album_type: str | tuple[str, int],
+    page_number: int,
+    base_page: str = AOTY_URL,
+    ratings_subpage: str = "ratings/user-highest-rated",
+    debug: bool = defaults.DEBUG,
+) -> list[int]:
+    album_type, year = aoty_shard(album_type)
+    url = f"{base_page}/{ratings_subpage}/{album_type}/{year}/{page_number}/"
+    albums_list = get_data.table(
+        url=url,
+        id="centerContent",
+        strainer=aoty_tags.list_page,
+        debug=debug,
+    )
+    if albums_list is None:
+        return []
+    scores = []
+    for data in albums_list.find_all(class_="albumListRow"):
+        album = {}
+        get_data.data(
+            element=data, data_struct=album, tags=aoty_tags.list_score
+        )
+        scores.append(album.get("user_score") or 0)
+    return scores
+
+
+def aoty_last_page(
+    album_type: str | tuple[str, int],
+    start_page: int,
+    min_score: int | float,
+    base_page: str = AOTY_URL,
+    ratings_subpage: str = "ratings/user-highest-rated",
+    quiet: bool = defaults.QUIET,
+    debug: bool = defaults.DEBUG,
+) -> int:
+    logger = logging.logger(aoty_last_page)
+    name, year = aoty_shard(album_type)
+    key = f"{base_page}/{ratings_subpage}/{name}/{year}/{min_score}"
+    if year != "all":
+        name += f" of {year}"
+
+    def relevant(page_number: int) -> bool:
+        scores = aoty_scores(
+            album_type,
+            page_number,
+            base_page=base_page,
+            ratings_subpage=ratings_subpage,
+            debug=debug,
+        )
+        return bool(scores) and scores[0] >= min_score
+
+    last = boundary.search(
+        relevant, start=start_page, hint=boundary.load(key)
+    )
+    boundary.save(key, last)
+    if debug:
+        logger.info(f"Last page of {name} with {min_score} is {last}.")
+    if not quiet:
+        print(f"- Found {last - start_page + 1} pages of {name}.")
+    return last
 
 
 def aoty(
-    album_type: str,
+    album_type: str | tuple[str, int],
     page_number: int,
-    base_page: str = "https://www.albumoftheyear.org",
+    base_page: str = AOTY_URL,
     ratings_subpage: str = "ratings/user-highest-rated",
     list_tags: dict = aoty_tags.album_list,
     album_tags: dict = aoty_tags.album,
+    fields: tuple = AOTY_FIELDS,
+    known: dict[int, dict] | None = None,
+    max_age: int | None = MAX_AGE,
+    min_score: int | float = 0,
+    max_score: int | float = 100,
     ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    failed: DeadLetters | None = None,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
 ) -> Iterator[Album]:
     logger = logging.logger(aoty)
-    message = f"- Downloading {album_type}, page {page_number}..."
+    unit = (album_type, page_number)
+    album_type, year = aoty_shard(album_type)
+    message = (
+        f"- Downloading {album_type}"
+        + (f" of {year}" if year != "all" else "")
+        + f", page {page_number}..."
+    )
     if debug:
         logger.info(message + f", ceil = {ceil}")
     if not quiet:
         print(message)
-    album = Album()
-    url = f"{base_page}/{ratings_subpage}/{album_type}/all/{page_number}/"
+    url = f"{base_page}/{ratings_subpage}/{album_type}/{year}/{page_number}/"
     if debug:
         logger.debug(f"URL is {url}")
     albums_list = get_data.table(
         url=url,
         id="centerContent",
+        strainer=aoty_tags.list_page,
         debug=debug,
     )
+    if albums_list is None:
+        logger.warning(f"No list of albums found in {url}.")
+        return
+    albums = []
     for data in albums_list.find_all(class_="albumListRow"):
+        album = Album()
         album["internal_id"] = -1
         album["type"] = album_type
         album["page_number"] = page_number
@@ -98,29 +770,110 @@ def aoty(
         album["internal_id"] = int(
             tuple(album_url.split("album/", 1))[-1].split("-", 1)[0]
         )
-        album_data = get_data.table(
-            url=album_url, id="centerContent", debug=debug
+        score = album.get("user_score")
+        if score and not min_score <= score <= max_score:
+            # Yielded without details: until() skips the rows above the
+            # maximum, and stops the crawl on the first one below minimum.
+            albums.append((album, album_url, False))
+            if score < min_score:
+                break
+            continue
+        old = reuse(album, album_url, known, max_age)
+        albums.append(
+            (old if old else album, album_url, old is None and bool(fields))
         )
-        get_data.data(element=album_data, data_struct=album, tags=album_tags)
-        album["tracks"], album["total_length"] = get_data.aoty_tracks(
-            url=album_url,
-            debug=debug,
+    if debug:
+        logger.info(
+            f"Downloading details of {sum(f for _, _, f in albums)} "
+            + f"of {len(albums)} albums."
         )
-        if not album["total_length"]:
-            del album["total_length"]
+    fetching = tuple((a, u) for a, u, fetch in albums if fetch)
+    done = engine.run(
+        (
+            partial(
+                try_details,
+                partial(
+                    aoty_details, album, album_url, album_tags, fields, debug
+                ),
+                album,
+                album_url,
+                unit,
+                failed,
+            )
+            for album, album_url in fetching
+        ),
+        concurrency=concurrency,
+    )
+    dropped = {id(a) for (a, _), ok in zip(fetching, done) if not ok}
+    for album, _, _ in albums:
+        if id(album) in dropped:
+            if limit.exhausted():
+                break  # The rest of the list is out of the limit.
+            continue
         if debug:
             logger.debug(pprint.pformat(album))
-        yield album.copy()
-        album.clear()
+        yield album
+
+
+def prog_album(
+    album: Album,
+    album_url: str,
+    album_tags: dict = prog_tags.album,
+    fields: tuple = PROG_FIELDS,
+) -> None:
+    if "details" in fields:
+        album_data = get_data.table(
+            url=album_url,
+            tag="td",
+            encoding="latin1",
+            strainer=prog_tags.album_page,
+        )
+        get_data.data(element=album_data, data_struct=album, tags=album_tags)
+    if "score_distribution" in fields:
+        album["score_distribution"] = get_data.prog_distribution_score(
+            album_url
+        )
+    if "tracks" in fields:
+        album["tracks"], album["total_length"] = get_data.prog_tracks(
+            album_url
+        )
+    album["detail_date"] = datetime.now()
+
+
+def prog_details(
+    album: Album,
+    album_url: str,
+    album_tags: dict = prog_tags.album,
+    fields: tuple = PROG_FIELDS,
+) -> None:
+    """
+    Details of an album, downloaded once per download.
+
+    The same album can be listed in more than one genre or type, so its
+    details are shared by `internal_id` between the lists.
+    """
+
+    def download() -> dict:
+        job = partial(__details__, prog_album, album_url, album_tags, fields)
+        return pipeline.parse(job, album_url) if pipeline.enabled() else job()
+
+    album.update(memo.DETAILS.get((album["internal_id"], fields), download))
 
 
 def prog(
     genre: tuple[str, int],
     album_type: tuple[str, int],
-    base_page: str = "https://www.progarchives.com/",
+    base_page: str = PROG_URL + "/",
     list_tags: dict = prog_tags.album_list,
     album_tags: dict = prog_tags.album,
+    fields: tuple = PROG_FIELDS,
+    known: dict[int, dict] | None = None,
+    max_age: int | None = MAX_AGE,
+    min_score: int | float = 0,
+    max_score: int | float = 100,
     ceil: bool = defaults.CEIL,
+    concurrency: int = CONCURRENCY,
+    failed: DeadLetters | None = None,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
@@ -131,7 +884,6 @@ def prog(
         logger.info(message + f", ceil = {ceil}")
     if not quiet:
         print(message)
-    album = Album()
     url = (
         base_page
         + "top-prog-albums.asp"
@@ -142,29 +894,64 @@ def prog(
     if debug:
         logger.debug(f"URL is {url}")
     albums_list = get_data.table(
-        url=url, tag="table", number=1, encoding="latin1"
+        url=url,
+        tag="table",
+        number=1,
+        encoding="latin1",
+        strainer=prog_tags.list_page,
     )
+    albums = []
     for data in albums_list.find_all("tr"):
+        album = Album()
         album["type"] = album_type[0]
         album["genre"] = genre[0]
         get_data.data(element=data, data_struct=album, tags=list_tags)
         album_url = base_page + str(album["album_url"])
         album["internal_id"] = int(tuple(album_url.split("?id="))[-1])
-        album_data = get_data.table(url=album_url, tag="td", encoding="latin1")
-        get_data.data(element=album_data, data_struct=album, tags=album_tags)
         album["user_score"] = (math.ceil if ceil else math.floor)(
             album["qwr"] * 20
         )
-        album["score_distribution"] = get_data.prog_distribution_score(
-            album_url
+        score = album.get("user_score")
+        if score and not min_score <= score <= max_score:
+            # Yielded without details: until() skips the rows above the
+            # maximum, and stops the crawl on the first one below minimum.
+            albums.append((album, album_url, False))
+            if score < min_score:
+                break
+            continue
+        old = reuse(album, album_url, known, max_age)
+        albums.append(
+            (old if old else album, album_url, old is None and bool(fields))
         )
-        album["tracks"], album["total_length"] = get_data.prog_tracks(
-            album_url
+    if debug:
+        logger.info(
+            f"Downloading details of {sum(f for _, _, f in albums)} "
+            + f"of {len(albums)} albums."
         )
+    fetching = tuple((a, u) for a, u, fetch in albums if fetch)
+    done = engine.run(
+        (
+            partial(
+                try_details,
+                partial(prog_details, album, album_url, album_tags, fields),
+                album,
+                album_url,
+                (genre, album_type),
+                failed,
+            )
+            for album, album_url in fetching
+        ),
+        concurrency=concurrency,
+    )
+    dropped = {id(a) for (a, _), ok in zip(fetching, done) if not ok}
+    for album, _, _ in albums:
+        if id(album) in dropped:
+            if limit.exhausted():
+                break  # The rest of the list is out of the limit.
+            continue
         if debug:
             logger.debug(pprint.pformat(album))
-        yield album.copy()
-        album.clear()
+        yield album
 
 
 def dirs(
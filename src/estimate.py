@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+from functools import partial
+
+from src import boundary, dump
+from src.defaults import defaults
+from src.defaults.download import (
+    AOTY_FIELDS,
+    AOTY_PER_PAGE,
+    AOTY_URL,
+    CONCURRENCY,
+    HOST_CONCURRENCY,
+    PROG_FIELDS,
+    PROG_PER_PAGE,
+    PROG_URL,
+    REQUEST_TIME,
+)
+from src.get import archive, cache, data as get_data, memo
+
+# Every part of an album page is read from the same page, downloaded once.
+DETAIL_PAGES = 1
+
+
+def __stored__(url: str) -> bytes | None:
+    # A page downloaded before, from the cache or the archive.
+    cached = cache.STORE.get(url)
+    if cached is not None:
+        return cached[1]
+    archived = archive.STORE.get(url)
+    return archived.body if archived is not None else None
+
+
+def __read__(url: str, body: bytes, function):
+    # `function` parses the stored page of `url` instead of downloading it.
+    get_data.bodies[url] = body
+    try:
+        return function()
+    finally:
+        get_data.bodies.pop(url, None)
+
+
+def __estimate__(
+    lists: int,
+    list_pages: int,
+    albums: int,
+    album_pages: int,
+    unknown: list,
+    downloaded: int = 0,
+    concurrency: int = CONCURRENCY,
+    request_time: float = REQUEST_TIME,
+) -> dict:
+    requests = list_pages + album_pages
+    return {
+        "lists": lists,
+        "list_pages": list_pages,
+        "albums": albums,
+        "album_pages": album_pages,
+        "requests": requests,
+        "seconds": requests
+        * request_time
+        / max(1, min(concurrency, HOST_CONCURRENCY)),
+        "unknown": unknown,
+        "downloaded": downloaded,
+    }
+
+
+def aoty(
+    types: tuple,
+    start_page: int = 1,
+    min_score: int | float = 0,
+    max_score: int | float = 100,
+    base_url: str = AOTY_URL,
+    ratings_subpage: str = "ratings/user-highest-rated",
+    fields: tuple = AOTY_FIELDS,
+    concurrency: int = CONCURRENCY,
+    request_time: float = REQUEST_TIME,
+) -> dict:
+    """
+    Requests of a download of AOTY, from the last pages found before.
+
+    Every list is downloaded up to the last page with albums above
+    `min_score`, plus the next one (to confirm it). Pages downloaded
+    before are read from the cache or the archive to count their albums
+    between the scores, and the rest count as full pages. Lists without a
+    known last page count as a single full page.
+    """
+    list_pages, albums, unknown = 0, 0, []
+    for album_type in types:
+        name, year = dump.aoty_shard(album_type)
+        last = boundary.load(
+            f"{base_url}/{ratings_subpage}/{name}/{year}/{min_score}"
+        )
+        if last is None:
+            unknown.append(album_type)
+            last = start_page
+        list_pages += max(0, last - start_page + 1) + 1
+        for page_number in range(start_page, last + 1):
+            url = (
+                f"{base_url}/{ratings_subpage}/{name}/{year}/{page_number}/"
+            )
+            body = __stored__(url)
+            if body is None:
+                albums += AOTY_PER_PAGE
+                continue
+            scores = __read__(
+                url,
+                body,
+                partial(
+                    dump.aoty_scores,
+                    album_type,
+                    page_number,
+                    base_page=base_url,
+                    ratings_subpage=ratings_subpage,
+                ),
+            )
+            albums += sum(min_score <= s <= max_score for s in scores)
+    memo.clear()
+    return __estimate__(
+        lists=len(types),
+        list_pages=list_pages,
+        albums=albums,
+        album_pages=albums * DETAIL_PAGES if fields else 0,
+        unknown=unknown,
+        concurrency=concurrency,
+        request_time=request_time,
+    )
+
+
+def prog_genres(base_url: str = PROG_URL) -> tuple[tuple, bool]:
+    """
+    Genres of ProgArchives, and whether their page had to be downloaded.
+
+    The page is read from the cache or the archive when it is there.
+    """
+    body = __stored__(base_url)
+    if body is None:
+        return tuple(get_data.prog_genres(prog_url=base_url).items()), True
+    found = __read__(
+        base_url, body, partial(get_data.prog_genres, prog_url=base_url)
+    )
+    memo.clear()
+    return tuple(found.items()), False
+
+
+def prog(
+    genres: tuple,
+    types: tuple,
+    min_score: int | float = 0,
+    max_score: int | float = 100,
+    ceil: bool = defaults.CEIL,
+    base_url: str = PROG_URL,
+    fields: tuple = PROG_FIELDS,
+    downloaded: int = 0,
+    concurrency: int = CONCURRENCY,
+    request_time: float = REQUEST_TIME,
+) -> dict:
+    """
+    Requests of a download of ProgArchives, from the cached lists.
+
+    Every genre and type is a single list page, read from the cache or the
+    archive when it is there to count its albums between the scores, or
+    counted with the most albums a list has otherwise. Albums in more than
+    one list have their page downloaded once.
+    """
+    list_pages, albums, unknown = 1, 0, []  # Plus the page of genres.
+    ids = set()
+    function = partial(
+        dump.prog,
+        base_page=base_url + "/",
+        fields=(),
+        min_score=min_score,
+        max_score=max_score,
+        ceil=ceil,
+        quiet=True,
+    )
+    for genre in genres:
+        for album_type in types:
+            list_pages += 1
+            url = (
+                f"{base_url}/top-prog-albums.asp?ssubgenres={genre[1]}"
+                + f"&salbumtypes={album_type[1]}&smaxresults=250#list"
+            )
+            body = __stored__(url)
+            if body is None:
+                unknown.append((genre[0], album_type[0]))
+                albums += PROG_PER_PAGE
+                continue
+            listed = [
+                a
+                for a in __read__(
+                    url, body, lambda: list(function(genre, album_type))
+                )
+                if min_score <= (a.get("user_score") or 0) <= max_score
+            ]
+            albums += len(listed)
+            ids.update(a["internal_id"] for a in listed)
+    memo.clear()
+    album_pages = len(ids) + len(unknown) * PROG_PER_PAGE
+    return __estimate__(
+        lists=len(genres) * len(types),
+        list_pages=list_pages,
+        albums=albums,
+        album_pages=album_pages * DETAIL_PAGES if fields else 0,
+        unknown=unknown,
+        downloaded=downloaded,
+        concurrency=concurrency,
+        request_time=request_time,
+    )
+
+
+def report(name: str, estimate: dict) -> str:
+    unknown = len(estimate["unknown"])
+    return (
+        f"Estimate of {name}, {estimate['lists']} lists:\n"
+        + f"- {estimate['list_pages']} list pages"
+        + (
+            f" ({unknown} of the lists not downloaded before, guessed)"
+            if unknown
+            else ""
+        )
+        + ".\n"
+        + f"- {estimate['albums']} albums, {estimate['album_pages']} "
+        + "album pages.\n"
+        + f"- {estimate['requests']} requests, about "
+        + f"{estimate['seconds'] / 60:.1f} minutes."
+        + (
+            "\n- Pages downloaded for the estimate: "
+            + f"{estimate['downloaded']}."
+            if estimate["downloaded"]
+            else ""
+        )
+    )
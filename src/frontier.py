@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+import socket
+import sqlite3
+from collections.abc import Hashable, Iterable, Iterator
+from pathlib import Path
+from threading import get_ident, local
+from time import time
+
+from src.debug import logging
+from src.defaults import path
+from src.defaults.download import LEASE
+
+PENDING, CLAIMED, DONE = "pending", "claimed", "done"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS params (params BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS finished (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    owner TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    key TEXT PRIMARY KEY,
+    a BLOB NOT NULL,
+    b BLOB NOT NULL,
+    shard INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    priority INTEGER NOT NULL,
+    bounded INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    claimed REAL,
+    albums BLOB,
+    last INTEGER
+);
+CREATE INDEX IF NOT EXISTS queue ON units (state, priority, shard, page);
+"""
+
+
+def owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{get_ident()}"
+
+
+class Frontier:
+    """
+    Queue of the units of a download, in SQLite, shared by processes.
+
+    A unit is one call of the dump function (an AOTY type and page, or a
+    ProgArchives genre and type), or the search of the pages of a list
+    (with `b` as None). Units are pending, claimed by a process (for
+    `lease` seconds, after which they are pending again, as the process
+    may be gone) or done, with the albums they produced and whether they
+    reached the minimum score. `shard` and `page` keep the order of the
+    albums, and `priority` the order of the units: the first pages of
+    every list come before the next ones.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: dict,
+        directory: Path = path.FRONTIER,
+        lease: float = LEASE,
+    ):
+        logger = logging.logger(Frontier)
+        self.file = directory / f"{name}.sqlite"
+        self.params = params
+        self.lease = lease
+        self.local = local()
+        with self.__connection__() as db:
+            db.executescript(SCHEMA)
+        with self.__transaction__() as db:
+            row = db.execute("SELECT params FROM params").fetchone()
+            if row is not None and pickle.loads(row[0]) != params:
+                logger.warning(
+                    f"Frontier {self.file.name} was written with "
+                    + f"{pickle.loads(row[0])}, not {params}. Starting the "
+                    + "download over."
+                )
+                db.execute("DELETE FROM units")
+                db.execute("DELETE FROM finished")
+                row = None
+            if row is None:
+                db.execute("DELETE FROM params")
+                db.execute(
+                    "INSERT INTO params VALUES (?)", (pickle.dumps(params),)
+                )
+
+    def __connection__(self) -> sqlite3.Connection:
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = self.local.db = sqlite3.connect(
+                self.file, timeout=60, isolation_level=None
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+        return db
+
+    def __transaction__(self) -> "Transaction":
+        return Transaction(self.__connection__())
+
+    def __len__(self) -> int:
+        return self.__count__(DONE)
+
+    def __count__(self, *states: str) -> int:
+        return self.__connection__().execute(
+            "SELECT COUNT(*) FROM units WHERE state IN "
+            + f"({', '.join('?' * len(states))})",
+            states,
+        ).fetchone()[0]
+
+    def add(
+        self,
+        units: Iterable[tuple[Hashable, Hashable, int, int, int, bool]],
+    ) -> None:
+        # Units already added (by this or another process) are kept as is.
+        with self.__transaction__() as db:
+            db.executemany(
+                "INSERT OR IGNORE INTO units "
+                + "(key, a, b, shard, page, priority, bounded) "
+                + "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        repr((a, b)),
+                        pickle.dumps(a),
+                        pickle.dumps(b),
+                        shard,
+                        page,
+                        priority,
+                        bounded,
+                    )
+                    for a, b, shard, page, priority, bounded in units
+                ),
+            )
+
+    def claim(self, by: str | None = None) -> dict | None:
+        with self.__transaction__() as db:
+            row = db.execute(
+                "SELECT key, a, b, shard, page, bounded, attempts FROM units "
+                + "WHERE state = ? OR (state = ? AND claimed < ?) "
+                + "ORDER BY priority, shard, page LIMIT 1",
+                (PENDING, CLAIMED, time() - self.lease),
+            ).fetchone()
+            if row is None:
+                return None
+            key, a, b, shard, page, bounded, attempts = row
+            db.execute(
+                "UPDATE units SET state = ?, owner = ?, claimed = ?, "
+                + "attempts = attempts + 1 WHERE key = ?",
+                (CLAIMED, by or owner(), time(), key),
+            )
+        return {
+            "a": pickle.loads(a),
+            "b": pickle.loads(b),
+            "shard": shard,
+            "page": page,
+            "bounded": bool(bounded),
+            "attempts": attempts + 1,
+        }
+
+    def done(
+        self,
+        a: Hashable,
+        b: Hashable,
+        albums: list[dict],
+        last: bool,
+    ) -> None:
+        with self.__transaction__() as db:
+            db.execute(
+                "UPDATE units SET state = ?, albums = ?, last = ? "
+                + "WHERE key = ?",
+                (DONE, pickle.dumps(albums), last, repr((a, b))),
+            )
+
+    def release(self, a: Hashable, b: Hashable) -> None:
+        with self.__transaction__() as db:
+            db.execute(
+                "UPDATE units SET state = ?, owner = NULL, claimed = NULL "
+                + "WHERE key = ?",
+                (PENDING, repr((a, b))),
+            )
+
+    def busy(self) -> bool:
+        return self.__count__(PENDING, CLAIMED) > 0
+
+    def finish(self, by: str | None = None) -> bool:
+        """
+        Whether the caller is the one (and only) process to save the
+        download, once every unit is done.
+        """
+        with self.__transaction__() as db:
+            if db.execute(
+                "SELECT COUNT(*) FROM units WHERE state != ?", (DONE,)
+            ).fetchone()[0]:
+                return False
+            return (
+                db.execute(
+                    "INSERT OR IGNORE INTO finished VALUES (1, ?)",
+                    (by or owner(),),
+                ).rowcount
+                == 1
+            )
+
+    def albums(self) -> Iterator[dict]:
+        """
+        Albums of the done units, in the order of the lists, up to the
+        first unit of every list not done yet.
+        """
+        rows = self.__connection__().execute(
+            "SELECT shard, state, albums, last FROM units "
+            + "WHERE page >= 0 ORDER BY shard, page"
+        )
+        stopped = None
+        for shard, state, albums, last in rows:
+            if shard == stopped:
+                continue
+            if state != DONE:
+                stopped = shard
+                continue
+            yield from pickle.loads(albums)
+            if last:
+                stopped = shard
+
+    def stats(self) -> dict[str, int]:
+        return dict(
+            self.__connection__()
+            .execute("SELECT state, COUNT(*) FROM units GROUP BY state")
+            .fetchall()
+        )
+
+    def remove(self) -> None:
+        db = getattr(self.local, "db", None)
+        if db is not None:
+            db.close()
+            self.local.db = None
+        for suffix in ("", "-wal", "-shm"):
+            self.file.with_name(self.file.name + suffix).unlink(
+                missing_ok=True
+            )
+
+
+class Transaction:
+    # Write transaction, taking the lock of the database at once, so units
+    # are claimed by a single process.
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, kind, error, traceback) -> None:
+        self.db.execute("ROLLBACK" if kind else "COMMIT")
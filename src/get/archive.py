@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import gzip
+import pickle
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from urllib.error import HTTPError
+
+from src.defaults import path
+from src.defaults.download import ARCHIVE, USER_AGENT
+from src.get import cache, memo
+from src.get.connection import Response
+
+SKIP_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def record(url: str, response: Response, date: datetime) -> bytes:
+    http = (
+        f"HTTP/1.1 {response.status} {response.reason}\r\n"
+        + "".join(
+            f"{k}: {v}\r\n"
+            for k, v in response.headers.items()
+            if k not in SKIP_HEADERS
+        )
+        + f"content-length: {len(response.body)}\r\n\r\n"
+    ).encode("latin1") + response.body
+    return (
+        "WARC/1.0\r\n"
+        + "WARC-Type: response\r\n"
+        + f"WARC-Target-URI: {url}\r\n"
+        + f"WARC-Date: {date.strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+        + "Content-Type: application/http; msgtype=response\r\n"
+        + f"Content-Length: {len(http)}\r\n\r\n"
+    ).encode("latin1") + http + b"\r\n\r\n"
+
+
+def parse(url: str, data: bytes) -> Response:
+    _, http = data.split(b"\r\n\r\n", 1)
+    head, body = http.split(b"\r\n\r\n", 1)
+    status_line, *lines = head.decode("latin1").split("\r\n")
+    _, status, reason = (status_line.split(" ", 2) + [""])[:3]
+    headers = dict(line.split(": ", 1) for line in lines if ": " in line)
+    return Response(url, int(status), reason, headers, body[:-4])
+
+
+class Archive:
+    """
+    Append-only archive of every fetched page, in the WARC format.
+
+    Each page is a gzip member of `pages.warc.gz`, so the file can be read
+    by WARC tools, and `pages.idx` maps every URL to its records by fetch
+    time. A page is only archived again when its content changes. In
+    offline mode pages are read from the archive instead of the website.
+    """
+
+    def __init__(
+        self,
+        directory: Path = path.ARCHIVE,
+        enabled: bool = ARCHIVE,
+        offline: bool = False,
+    ):
+        self.file = directory / "pages.warc.gz"
+        self.index_file = directory / "pages.idx"
+        self.enabled = enabled
+        self.offline = offline
+        self.index = None  # type: dict[str, tuple[int, int, str]] | None
+        self.lock = Lock()
+
+    def __load__(self) -> dict[str, tuple[int, int, str]]:
+        if self.index is None:
+            self.index = {}
+            if self.index_file.exists():
+                with open(self.index_file, encoding="utf-8") as f:
+                    for line in f:
+                        url, _, offset, length, digest = line.split("\t")
+                        # Later records of a URL replace the older ones.
+                        self.index[url] = (
+                            int(offset),
+                            int(length),
+                            digest.strip(),
+                        )
+        return self.index
+
+    def get(self, url: str) -> Response | None:
+        with self.lock:
+            entry = self.__load__().get(url)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        with open(self.file, "rb") as f:
+            f.seek(offset)
+            return parse(url, gzip.decompress(f.read(length)))
+
+    def put(self, url: str, response: Response) -> None:
+        digest = sha256(response.body).hexdigest()
+        date = datetime.now(timezone.utc)
+        data = gzip.compress(record(url, response, date))
+        with self.lock:
+            entry = self.__load__().get(url)
+            if entry and entry[2] == digest:
+                return
+            with open(self.file, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            with open(self.index_file, "a", encoding="utf-8") as f:
+                f.write(
+                    f"{url}\t{date.isoformat()}\t{offset}\t{len(data)}\t"
+                    + f"{digest}\n"
+                )
+            self.index[url] = (offset, len(data), digest)
+
+    def remember(self, name: str, params: dict) -> None:
+        with open(self.file.with_name(f"{name}.params"), "wb") as f:
+            pickle.dump(params, f)
+
+    def params(self, name: str) -> dict | None:
+        try:
+            with open(self.file.with_name(f"{name}.params"), "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def fetch(self, url: str, user_agent: str = USER_AGENT) -> Response:
+        if self.offline:
+            response = self.get(url)
+            if response is None:
+                raise HTTPError(url, 404, "Not archived", {}, None)
+            return response
+        response = cache.fetch(url=url, user_agent=user_agent)
+        memo.BODIES.put(url, response.body)
+        if self.enabled:
+            self.put(url, response)
+        return response
+
+
+STORE = Archive()
+
+
+def configure(enabled: bool = ARCHIVE, offline: bool = False) -> None:
+    STORE.enabled = enabled
+    STORE.offline = offline
+
+
+def fetch(url: str, user_agent: str = USER_AGENT) -> Response:
+    return STORE.fetch(url=url, user_agent=user_agent)
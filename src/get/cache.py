@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+import gzip
+import json
+import os
+import re
+from collections.abc import Iterable
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock, get_ident
+from time import time
+
+from src.debug import logging
+from src.defaults import defaults, path
+from src.defaults.download import (
+    CACHE,
+    CACHE_REFRESH,
+    CACHE_SIZE,
+    CACHE_TTL,
+    USER_AGENT,
+)
+from src.get import connection
+from src.get.connection import Response
+
+
+def ttl(url: str, rules: tuple = CACHE_TTL) -> int:
+    for pattern, seconds in rules:
+        if re.search(pattern, url):
+            return seconds
+    return 0
+
+
+def __write__(file: Path, data: bytes) -> None:
+    tmp = file.with_name(f"{file.name}.{os.getpid()}.{get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, file)
+
+
+class Cache:
+    """
+    Compressed on-disk cache of fetched pages.
+
+    Bodies are stored once per content hash under `pages/`, and each URL
+    has a small JSON entry under `urls/` pointing to its body along with
+    the validators (`ETag`, `Last-Modified`) used to revalidate it once it
+    is older than its TTL, or when it is expired before. The modification
+    time of the entries is used as the access time for the LRU eviction.
+    """
+
+    def __init__(
+        self,
+        directory: Path = path.CACHE,
+        max_size: int = CACHE_SIZE,
+        enabled: bool = CACHE,
+        refresh: bool = CACHE_REFRESH,
+        debug: bool = defaults.DEBUG,
+    ):
+        self.urls = directory / "urls"
+        self.pages = directory / "pages"
+        self.max_size = max_size
+        self.enabled = enabled
+        self.refresh = refresh
+        self.debug = debug
+        self.size = None
+        self.stale = set()  # type: set[str]
+        self.lock = Lock()
+        self.counters = dict.fromkeys(
+            ("hits", "misses", "revalidated", "stored", "evicted"), 0
+        )
+
+    def count(self, key: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[key] += value
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+    def expire(self, urls: Iterable[str]) -> None:
+        # Revalidated on their next fetch, whatever their TTL.
+        with self.lock:
+            self.stale.update(urls)
+
+    def __entry__(self, url: str) -> Path:
+        return self.urls / f"{sha256(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> tuple[dict, bytes] | None:
+        entry = self.__entry__(url)
+        try:
+            meta = json.loads(entry.read_text(encoding="utf-8"))
+            body = gzip.decompress((self.pages / meta["page"]).read_bytes())
+        except (OSError, ValueError, KeyError):
+            return None
+        entry.touch()
+        return meta, body
+
+    def put(self, url: str, response: Response) -> dict:
+        self.urls.mkdir(parents=True, exist_ok=True)
+        self.pages.mkdir(parents=True, exist_ok=True)
+        page = f"{sha256(response.body).hexdigest()}.gz"
+        page_path = self.pages / page
+        if not page_path.exists():
+            data = gzip.compress(response.body)
+            __write__(page_path, data)
+            self.__grow__(len(data))
+        meta = {
+            "url": url,
+            "page": page,
+            "fetched": time(),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        __write__(self.__entry__(url), json.dumps(meta).encode())
+        self.count("stored")
+        return meta
+
+    def __grow__(self, size: int) -> None:
+        with self.lock:
+            if self.size is None:
+                # Pages only, as the files of pages being written by other
+                # threads are renamed away meanwhile.
+                self.size = sum(
+                    f.stat().st_size for f in self.pages.glob("*.gz")
+                )
+            else:
+                self.size += size
+            if self.size <= self.max_size:
+                return
+            self.__evict__()
+
+    def __evict__(self) -> None:
+        logger = logging.logger(self.__evict__)
+        target = self.max_size * 0.9
+        entries = sorted(
+            self.urls.glob("*.json"), key=lambda f: f.stat().st_mtime
+        )
+        for entry in entries:
+            if self.size <= target:
+                break
+            try:
+                page = self.pages / json.loads(entry.read_text())["page"]
+                entry.unlink()
+                self.size -= page.stat().st_size
+                page.unlink()
+            except (OSError, ValueError, KeyError):
+                continue
+            self.counters["evicted"] += 1
+        if self.debug:
+            logger.info(
+                f"Evicted pages down to {self.size} bytes "
+                + f"({self.counters['evicted']} evicted so far)."
+            )
+
+    def fetch(
+        self,
+        url: str,
+        user_agent: str = USER_AGENT,
+    ) -> Response:
+        if not self.enabled:
+            return connection.fetch(url=url, user_agent=user_agent)
+        cached = self.get(url)
+        if cached is None:
+            self.count("misses")
+            response = connection.fetch(url=url, user_agent=user_agent)
+            self.put(url, response)
+            return response
+        meta, body = cached
+        with self.lock:
+            stale = url in self.stale
+        if (
+            not self.refresh
+            and not stale
+            and time() - meta["fetched"] < ttl(url)
+        ):
+            self.count("hits")
+            return Response(url, 200, "OK", {}, body)
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        response = connection.fetch(
+            url=url, headers=headers, user_agent=user_agent
+        )
+        with self.lock:
+            self.stale.discard(url)
+        if response.status == 304:
+            self.count("revalidated")
+            meta["fetched"] = time()
+            __write__(self.__entry__(url), json.dumps(meta).encode())
+            return Response(url, 200, "Not Modified", response.headers, body)
+        self.count("misses")
+        self.put(url, response)
+        return response
+
+
+STORE = Cache()
+
+
+def configure(
+    enabled: bool = CACHE,
+    refresh: bool = CACHE_REFRESH,
+    debug: bool = defaults.DEBUG,
+) -> None:
+    STORE.enabled = enabled
+    STORE.refresh = refresh
+    STORE.debug = debug
+
+
+def fetch(url: str, user_agent: str = USER_AGENT) -> Response:
+    return STORE.fetch(url=url, user_agent=user_agent)
+
+
+def expire(urls: Iterable[str]) -> None:
+    STORE.expire(urls)
+
+
+def stats() -> dict[str, int]:
+    return STORE.stats()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+import zlib
+from collections import defaultdict
+from io import BytesIO
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from queue import Empty, LifoQueue
+from threading import Lock
+from time import sleep
+from typing import NamedTuple
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+from src.debug import logging
+from src.defaults import defaults
+from src.get.throttle import Throttle, backoff, retry_after
+from src.defaults.download import (
+    ACCEPT_ENCODING,
+    HOST_CONCURRENCY,
+    MAX_REDIRECTS,
+    POOL_SIZE,
+    RETRIES,
+    THROTTLED,
+    TIMEOUT,
+    USER_AGENT,
+)
+
+REDIRECTS = (301, 302, 303, 307, 308)
+
+
+class Response(NamedTuple):
+    url: str
+    status: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+
+
+def decompress(body: bytes, encoding: str | None) -> bytes:
+    if encoding == "gzip":
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:  # Raw deflate stream, without zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class Pool:
+    """
+    Keep-alive HTTP(S) connections, shared per host and between threads.
+
+    Idle connections are kept in a LIFO queue per `(scheme, host)` so the
+    most recently used (and least likely to be closed by the server) socket
+    is picked first, up to `size` idle connections per host. The requests
+    sent to a host at the same time are limited by its `Throttle`, up to
+    `limit`, however many threads are downloading from it.
+    """
+
+    def __init__(
+        self,
+        size: int = POOL_SIZE,
+        timeout: float = TIMEOUT,
+        limit: int = HOST_CONCURRENCY,
+        debug: bool = defaults.DEBUG,
+    ):
+        self.size = size
+        self.timeout = timeout
+        self.limit = limit
+        self.debug = debug
+        self.idle = defaultdict(LifoQueue)
+        self.throttles = {}  # type: dict[tuple[str, str], Throttle]
+        self.lock = Lock()
+        self.counters = dict.fromkeys(
+            (
+                "requests",
+                "connections",
+                "reused",
+                "redirects",
+                "retries",
+                "compressed",
+                "bytes",
+            ),
+            0,
+        )
+
+    def count(self, key: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[key] += value
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+    def __connect__(self, host: tuple[str, str]) -> HTTPConnection:
+        self.count("connections")
+        scheme, netloc = host
+        cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return cls(netloc, timeout=self.timeout)
+
+    def __acquire__(
+        self, host: tuple[str, str]
+    ) -> tuple[HTTPConnection, bool]:
+        try:
+            conn = self.idle[host].get_nowait()
+        except Empty:
+            return self.__connect__(host), False
+        self.count("reused")
+        return conn, True
+
+    def __throttle__(self, host: tuple[str, str]) -> Throttle:
+        with self.lock:
+            if host not in self.throttles:
+                self.throttles[host] = Throttle(
+                    host[1], ceiling=self.limit, debug=self.debug
+                )
+            return self.throttles[host]
+
+    def __release__(self, host: tuple[str, str], conn: HTTPConnection):
+        if self.idle[host].qsize() < self.size:
+            self.idle[host].put(conn)
+        else:
+            conn.close()
+
+    def __send__(
+        self,
+        host: tuple[str, str],
+        target: str,
+        headers: dict[str, str],
+    ):
+        conn, reused = self.__acquire__(host)
+        try:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry once.
+            conn = self.__connect__(host)
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (HTTPException, OSError):
+                conn.close()
+                raise
+        if response.will_close:
+            conn.close()
+        else:
+            self.__release__(host, conn)
+        return response, body
+
+    def __fetch__(
+        self,
+        host: tuple[str, str],
+        target: str,
+        headers: dict[str, str],
+    ):
+        logger = logging.logger(self.__fetch__)
+        throttle = self.__throttle__(host)
+        for attempt in range(RETRIES + 1):
+            started = throttle.acquire()
+            try:
+                response, body = self.__send__(host, target, headers)
+            except (HTTPException, OSError) as e:
+                throttle.release(started, None)
+                if attempt == RETRIES:
+                    raise
+                if self.debug:
+                    logger.debug(f"Retrying {host[1]}{target} after {e!r}.")
+            else:
+                status = response.status
+                retry = (
+                    retry_after(response.getheader("Retry-After"))
+                    if status in THROTTLED
+                    else None
+                )
+                throttle.release(started, status, retry)
+                if status not in THROTTLED or attempt == RETRIES:
+                    return response, body
+                if self.debug:
+                    logger.debug(
+                        f"Retrying {host[1]}{target} after {status}."
+                    )
+            self.count("retries")
+            sleep(backoff(attempt))
+
+    def request(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        user_agent: str = USER_AGENT,
+    ) -> Response:
+        logger = logging.logger(self.request)
+        headers = {
+            "User-Agent": user_agent,
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        } | (headers if headers else {})
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            target = (parts.path or "/") + (
+                f"?{parts.query}" if parts.query else ""
+            )
+            self.count("requests")
+            response, body = self.__fetch__(
+                (parts.scheme, parts.netloc), target, headers
+            )
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            location = response_headers.get("location")
+            if response.status in REDIRECTS and location:
+                self.count("redirects")
+                url = urljoin(url, location)
+                continue
+            encoding = response_headers.get("content-encoding")
+            if encoding in ("gzip", "deflate"):
+                self.count("compressed")
+                body = decompress(body, encoding)
+            self.count("bytes", len(body))
+            return Response(
+                url, response.status, response.reason, response_headers, body
+            )
+        logger.error(f"Too many redirects for {url}")
+        raise HTTPError(url, 310, "Too many redirects", {}, None)
+
+
+POOL = Pool()
+
+
+def configure(debug: bool = defaults.DEBUG) -> None:
+    with POOL.lock:
+        POOL.debug = debug
+        for throttle in POOL.throttles.values():
+            throttle.debug = debug
+
+
+def fetch(
+    url: str,
+    headers: dict[str, str] | None = None,
+    user_agent: str = USER_AGENT,
+) -> Response:
+    response = POOL.request(url, headers=headers, user_agent=user_agent)
+    if response.status >= 400:
+        # The page of the error is kept, as the body of the HTTPError.
+        raise HTTPError(
+            url,
+            response.status,
+            response.reason,
+            response.headers,
+            BytesIO(response.body),
+        )
+    return response
+
+
+def stats() -> dict[str, int]:
+    return POOL.stats()
+
+
+def throttles() -> dict[str, float]:
+    with POOL.lock:
+        return {h[1]: t.limit for h, t in POOL.throttles.items()}
@@ -2,15 +2,92 @@
 
 import re
 from collections import UserDict
+from copy import copy
 from datetime import timedelta
-from urllib.request import Request, urlopen
+from functools import partial
+from threading import Lock
+from time import perf_counter
+from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 
-from src.attributes import aoty as aoty_tags
+from src.attributes import aoty as aoty_tags, prog as prog_tags
 from src.classes.Album import Album
 from src.debug import logging
 from src.defaults import defaults
+from src.defaults.download import (
+    AOTY_PARSER,
+    AOTY_URL,
+    PROG_PARSER,
+    PROG_URL,
+    USER_AGENT,
+)
+from src.get import archive, extract, memo
+
+PARSERS = {
+    urlsplit(AOTY_URL).netloc: AOTY_PARSER,
+    urlsplit(PROG_URL).netloc: PROG_PARSER,
+}
+parse_lock = Lock()
+parse_times = {}  # type: dict[str, dict[str, int | float]]
+# Pages already downloaded, parsed instead of fetching them (as done by
+# the processes of `src.get.pipeline`).
+bodies = {}  # type: dict[str, bytes]
+
+
+def use_parser(url: str, parser: str) -> None:
+    logger = logging.logger(use_parser)
+    if builder_registry.lookup(parser) is None:
+        logger.warning(
+            f"Parser `{parser}` is not installed, using `html.parser` for "
+            + f"{url}."
+        )
+        parser = "html.parser"
+    PARSERS[urlsplit(url).netloc] = parser
+
+
+def parse_stats() -> dict[str, dict[str, int | float]]:
+    with parse_lock:
+        return {k: dict(v) for k, v in parse_times.items()}
+
+
+def page(
+    url: str,
+    user_agent: str = USER_AGENT,
+    encoding: str = "utf-8",
+    parser: str = "html.parser",
+    strainer: SoupStrainer | None = None,
+    debug: bool = defaults.DEBUG,
+) -> BeautifulSoup:
+    logger = logging.logger(page)
+    body = bodies.get(url)
+    if body is None:
+        response = archive.fetch(url=url, user_agent=user_agent)
+        body = response.body
+        if debug:
+            logger.info(
+                f"Got response from web server ({response.status}, "
+                + f"{len(body)} bytes)."
+            )
+    html = body.decode(encoding)
+    start = perf_counter()
+    soup = BeautifulSoup(html, parser, parse_only=strainer)
+    elapsed = perf_counter() - start
+    with parse_lock:
+        times = parse_times.setdefault(
+            parser, {"pages": 0, "seconds": 0.0, "bytes": 0}
+        )
+        times["pages"] += 1
+        times["seconds"] += elapsed
+        times["bytes"] += len(body)
+    if debug:
+        logger.info(
+            f"Parse with BS4 ({parser}"
+            + (", strained" if strainer else "")
+            + f") completed in {elapsed * 1000:.1f} ms."
+        )
+    return soup
 
 
 def table(
@@ -18,9 +95,10 @@ def table(
     tag: str | None = None,
     id: str | None = None,
     number: int = 0,
-    user_agent: str = "Mozilla/5.0",
+    user_agent: str = USER_AGENT,
     encoding: str = "utf-8",
-    parser: str = "html.parser",
+    parser: str | None = None,
+    strainer: SoupStrainer | None = None,
     recursive: bool = True,
     debug: bool = defaults.DEBUG,
 ):
@@ -35,16 +113,20 @@ def table(
             + (id if id else "N/A")
         )
     data = None
-    req = Request(url=url, headers={"User-Agent": user_agent})
-    if debug:
-        logger.info("Request successful.")
-    with urlopen(req) as response:
-        html = response.read().decode(encoding)
-    if debug:
-        logger.info("Got response from web server.")
-    soup = BeautifulSoup(html, parser)
-    if debug:
-        logger.info("Parse with BS4 completed.")
+    if not parser:
+        parser = PARSERS.get(urlsplit(url).netloc, "html.parser")
+    soup = memo.PAGES.get(
+        (url, encoding, parser, strainer),
+        partial(
+            page,
+            url=url,
+            user_agent=user_agent,
+            encoding=encoding,
+            parser=parser,
+            strainer=strainer,
+            debug=debug,
+        ),
+    )
     if soup:
         data = (
             soup.find_all(tag, id=id, recursive=recursive)
@@ -62,78 +144,26 @@ def table(
     )
 
 
-def find_tag(element, values):
-    if "tag" in values:
-        if "class" in values:
-            d = element.find_all(
-                values["tag"], class_=values["class"], recursive=True
-            )
-        else:
-            d = element.find_all(values["tag"])
-        i = values["number"] if "number" in values else 0
-        if len(d) > abs(i + 1 if i < 0 else i):
-            return d[i]
-        else:
-            return None
-    else:
-        return element
-
-
 def data(
     element,
     data_struct: Album | dict,
     tags: dict,
     include_none: bool = defaults.INCLUDE_NONE,
 ) -> None:
-    for k, v in tags.items():
-        d = find_tag(element=element, values=v)
-        if d and "subtag" in v:
-            d = find_tag(element=d, values=v["subtag"])
-        if d and "key" in v:
-            d = d.get(v["key"])
-        if d and "contains" in v and isinstance(v["contains"], dict):
-            data_struct[k] = None
-            data(element=d, data_struct=data_struct, tags=dict(v["contains"]))
-        if d and "expand" in v:
-            if "expand_url" in v:
-                d = list(
-                    {v["expand_url"]: e.get_text(), "url": e.get("href")}
-                    for e in d.find_all(v["expand"])
-                    if e.get("href") != "#"
-                )
-            else:
-                d = list(e.get_text() for e in d.find_all(v["expand"]))
-        if d and ("type" in v or "replace" in v or "match" in v):
-            if not isinstance(d, str) and (
-                any(v["type"] == t for t in ("str", "int", "float"))
-            ):
-                d = d.get_text().strip()
-            if "match" in v:
-                d = re.search(v["match"], d)
-                d = d.group() if d else None
-            if "replace" in v and isinstance(v["replace"], dict):
-                for kr, vr in v["replace"].items():
-                    d = d.replace(kr, vr)
-            if any(v["type"] == t for t in ("int", "float")):
-                d = (
-                    int(d)
-                    if v["type"] == "int" and d.isdigit()
-                    else float(d)
-                    if v["type"] == "float" and d.replace(".", "", 1).isdigit()
-                    else None
-                )
-        if d:
-            data_struct[k] = d
-        elif include_none:
-            data_struct[k] = None
+    extract.extractor(tags).extract(
+        element=element,
+        data_struct=data_struct,
+        include_none=include_none,
+    )
 
 
 def aoty_tracks(
     url: str,
     id: str = "tracklist",
-    user_agent: str = "Mozilla/5.0",
+    user_agent: str = USER_AGENT,
     encoding: str = "utf-8",
-    parser: str = "html.parser",
+    parser: str | None = None,
+    strainer: SoupStrainer | None = aoty_tags.album_page,
     tags: dict = aoty_tags.tracklist,
     include_none: bool = defaults.INCLUDE_NONE,
     quiet: bool = defaults.QUIET,
@@ -149,8 +179,11 @@ def aoty_tracks(
         user_agent=user_agent,
         encoding=encoding,
         parser=parser,
+        strainer=strainer,
         debug=debug,
     )
+    if tracklist is None:
+        raise LookupError(f"Didn't find any tracklist for {url}")
     tracks = []  # type: list[dict]
     track = {}
     total_length = timedelta()
@@ -194,21 +227,27 @@ def aoty_tracks(
             for num, li in enumerate(simple_tl, start=1)
         ], total_length
     else:
-        logger.error(f"Didn't find any tracklist for {url}")
         if debug:
             logger.debug(tracklist)
-        exit(1)
+        raise LookupError(f"Didn't find any tracklist for {url}")
 
 
 def prog_genres(
-    prog_url: str = "https://www.progarchives.com",
+    prog_url: str = PROG_URL,
     id_table: str = "navGenre",
     encoding: str = "latin1",
+    strainer: SoupStrainer | None = prog_tags.genres_page,
     quiet: bool = defaults.QUIET,
     verbose: bool = defaults.VERBOSE,
     debug: bool = defaults.DEBUG,
 ) -> dict:
-    prog_table = table(url=prog_url, id=id_table, encoding=encoding)
+    prog_table = table(
+        url=prog_url,
+        id=id_table,
+        encoding=encoding,
+        strainer=strainer,
+        debug=debug,
+    )
     return {
         g.string: int(g.get("href").split("=")[-1])
         for g in prog_table.find_all("a", recursive=True)
@@ -216,8 +255,18 @@ def prog_genres(
     }
 
 
-def prog_distribution_score(album_url: str) -> dict[str, int]:
-    prog_table = table(url=album_url, tag="blockquote", encoding="latin1")
+def prog_distribution_score(
+    album_url: str,
+    strainer: SoupStrainer | None = prog_tags.album_page,
+) -> dict[str, int]:
+    prog_table = copy(
+        table(
+            url=album_url,
+            tag="blockquote",
+            encoding="latin1",
+            strainer=strainer,
+        )
+    )  # Parsed pages are shared, so the original tree is left untouched.
     for t in prog_table.select("img") + prog_table.select("div"):
         t.extract()
     r = iter(range(5, 0, -1))
@@ -231,9 +280,14 @@ def prog_distribution_score(album_url: str) -> dict[str, int]:
 def prog_tracks(
     album_url: str,
     include_none: bool = defaults.INCLUDE_NONE,
+    strainer: SoupStrainer | None = prog_tags.album_page,
 ) -> tuple:
     prog_table = table(
-        url=album_url, tag="td", number=1, encoding="latin1"
+        url=album_url,
+        tag="td",
+        number=1,
+        encoding="latin1",
+        strainer=strainer,
     ).find_all("p")
     tracklist = re.sub(
         r"^<p.*?>", "", str(prog_table[0]).replace("<br/>", "\n")
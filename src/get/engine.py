@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
+
+from src.defaults.download import CONCURRENCY
+
+
+class Engine:
+    """
+    Thread pool downloading the pages of a run, shared by every list.
+
+    Jobs of every call (the album pages of a list page, the pages of a
+    list prefetched at once...) go to the same `concurrency` threads, so
+    nested calls don't multiply the threads. Jobs not started yet when
+    their result is needed are run by the waiting thread itself, so a job
+    waiting on its own jobs never waits on a pool busy with it.
+    """
+
+    def __init__(self, concurrency: int = CONCURRENCY):
+        self.concurrency = concurrency
+        self.executor = None  # type: ThreadPoolExecutor | None
+        self.lock = Lock()
+
+    def __executor__(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix="engine",
+                )
+            return self.executor
+
+    def stream(
+        self,
+        jobs: Iterable[Callable],
+        concurrency: int = CONCURRENCY,
+    ) -> Iterator:
+        """
+        Results of `jobs`, in order, as they are needed: at most
+        `concurrency` jobs of the call are in the pool at once, and the
+        next one is started when a result is taken.
+        """
+        jobs = iter(jobs)
+        if min(concurrency, self.concurrency) <= 1:
+            for job in jobs:
+                yield job()
+            return
+        executor = self.__executor__()
+        pending = deque(
+            (job, executor.submit(job)) for job in islice(jobs, concurrency)
+        )
+        try:
+            while pending:
+                job, future = pending.popleft()
+                result = job() if future.cancel() else future.result()
+                for job in islice(jobs, 1):
+                    pending.append((job, executor.submit(job)))
+                yield result
+        except BaseException:
+            # Also when the results aren't needed anymore (the generator
+            # is closed): jobs not started yet aren't run.
+            for _, future in pending:
+                future.cancel()
+            raise
+
+    def run(
+        self,
+        jobs: Iterable[Callable],
+        concurrency: int = CONCURRENCY,
+    ) -> list:
+        return list(self.stream(jobs, concurrency=concurrency))
+
+    def close(self) -> None:
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+ENGINE = Engine()
+
+
+def configure(concurrency: int = CONCURRENCY) -> None:
+    if concurrency != ENGINE.concurrency:
+        ENGINE.close()
+        ENGINE.concurrency = concurrency
+
+
+def run(jobs: Iterable[Callable], concurrency: int = CONCURRENCY) -> list:
+    return ENGINE.run(jobs, concurrency=concurrency)
+
+
+def stream(
+    jobs: Iterable[Callable], concurrency: int = CONCURRENCY
+) -> Iterator:
+    return ENGINE.stream(jobs, concurrency=concurrency)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import re
+from threading import Lock
+
+from bs4 import Tag
+
+from src.defaults import defaults
+
+NUMBERS = ("int", "float")
+TEXTS = ("str", "int", "float")
+
+
+def __pick__(found: list, number: int):
+    return (
+        found[number]
+        if len(found) > abs(number + 1 if number < 0 else number)
+        else None
+    )
+
+
+class Selector:
+    def __init__(self, values: dict):
+        self.tag = values.get("tag")
+        self.class_ = values.get("class")
+        self.number = values.get("number", 0)
+        self.key = (self.tag, self.class_)
+
+    def matches(self, tag: Tag) -> bool:
+        if tag.name != self.tag:
+            return False
+        if self.class_ is None:
+            return True
+        classes = tag.get("class")
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            return classes == self.class_
+        return self.class_ in classes or " ".join(classes) == self.class_
+
+    def find(self, element: Tag):
+        if self.tag is None:
+            return element
+        return __pick__(
+            [
+                d
+                for d in element.descendants
+                if isinstance(d, Tag) and self.matches(d)
+            ],
+            self.number,
+        )
+
+
+class Field:
+    def __init__(self, name: str, values: dict):
+        self.name = name
+        self.selector = Selector(values) if "tag" in values else None
+        self.subtag = (
+            Selector(values["subtag"]) if "subtag" in values else None
+        )
+        self.key = values.get("key")
+        self.contains = (
+            Extractor(values["contains"])
+            if isinstance(values.get("contains"), dict)
+            else None
+        )
+        self.expand = values.get("expand")
+        self.expand_url = values.get("expand_url")
+        self.convert = any(k in values for k in ("type", "replace", "match"))
+        self.type = values.get("type")
+        self.match = re.compile(values["match"]) if "match" in values else None
+        self.replace = (
+            tuple(values["replace"].items())
+            if isinstance(values.get("replace"), dict)
+            else None
+        )
+
+    def value(self, d, data_struct):
+        if d and self.subtag:
+            d = self.subtag.find(d)
+        if d and self.key:
+            d = d.get(self.key)
+        if d and self.contains:
+            data_struct[self.name] = None
+            self.contains.extract(d, data_struct)
+        if d and self.expand:
+            if self.expand_url:
+                d = list(
+                    {self.expand_url: e.get_text(), "url": e.get("href")}
+                    for e in d.find_all(self.expand)
+                    if e.get("href") != "#"
+                )
+            else:
+                d = list(e.get_text() for e in d.find_all(self.expand))
+        if d and self.convert:
+            if not isinstance(d, str) and self.type in TEXTS:
+                d = d.get_text().strip()
+            if self.match:
+                d = self.match.search(d)
+                d = d.group() if d else None
+            if d and self.replace:
+                for kr, vr in self.replace:
+                    d = d.replace(kr, vr)
+            if d and self.type in NUMBERS:
+                d = (
+                    int(d)
+                    if self.type == "int" and d.isdigit()
+                    else (
+                        float(d)
+                        if self.type == "float"
+                        and d.replace(".", "", 1).isdigit()
+                        else None
+                    )
+                )
+        return d
+
+
+class Extractor:
+    """
+    Attribute spec (see `src.attributes`) compiled into reusable fields.
+
+    Regexes, replacements and selectors are prepared once, and the
+    elements selected by every field are collected in a single traversal
+    of the row.
+    """
+
+    def __init__(self, tags: dict):
+        self.fields = tuple(Field(k, v) for k, v in tags.items())
+        self.selectors = {}
+        for f in self.fields:
+            if f.selector:
+                self.selectors.setdefault(f.selector.key, f.selector)
+
+    def __collect__(self, element: Tag) -> dict[tuple, list]:
+        found = {k: [] for k in self.selectors}
+        if not found:
+            return found
+        for d in element.descendants:
+            if not isinstance(d, Tag):
+                continue
+            for k, selector in self.selectors.items():
+                if selector.matches(d):
+                    found[k].append(d)
+        return found
+
+    def extract(
+        self,
+        element: Tag,
+        data_struct: dict,
+        include_none: bool = defaults.INCLUDE_NONE,
+    ) -> None:
+        found = self.__collect__(element)
+        for f in self.fields:
+            d = (
+                __pick__(found[f.selector.key], f.selector.number)
+                if f.selector
+                else element
+            )
+            d = f.value(d, data_struct)
+            if d:
+                data_struct[f.name] = d
+            elif include_none:
+                data_struct[f.name] = None
+
+
+compile_lock = Lock()
+compiled = {}  # type: dict[int, tuple[dict, Extractor]]
+
+
+def extractor(tags: dict) -> Extractor:
+    with compile_lock:
+        if id(tags) not in compiled:
+            compiled[id(tags)] = (tags, Extractor(tags))
+        return compiled[id(tags)][1]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+from threading import Lock
+from time import monotonic
+
+from src.defaults.download import MAX_REQUESTS, MAX_TIME
+from src.get import connection
+
+
+class Limit:
+    """
+    Requests and seconds a download can spend, 0 for no limit.
+
+    Once spent, no more list or album pages are started, and the download
+    is saved with the albums already downloaded: the highest scored ones,
+    as the lists are crawled from the top.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = MAX_REQUESTS,
+        max_time: float = MAX_TIME,
+    ):
+        self.max_requests = max_requests
+        self.max_time = max_time
+        self.lock = Lock()
+        self.start()
+
+    def start(self) -> None:
+        with self.lock:
+            self.requests = connection.stats()["requests"]
+            self.started = monotonic()
+            self.spent = False
+
+    def used(self) -> tuple[int, float]:
+        return (
+            connection.stats()["requests"] - self.requests,
+            monotonic() - self.started,
+        )
+
+    def exhausted(self) -> bool:
+        if self.spent:
+            return True
+        requests, seconds = self.used()
+        spent = (0 < self.max_requests <= requests) or (
+            0 < self.max_time <= seconds
+        )
+        if spent:
+            with self.lock:
+                self.spent = True
+        return spent
+
+    def stats(self) -> dict[str, int | float | bool]:
+        requests, seconds = self.used()
+        return {
+            "requests": requests,
+            "seconds": seconds,
+            "exhausted": self.spent,
+        }
+
+
+LIMIT = Limit()
+
+
+def configure(
+    max_requests: int = MAX_REQUESTS,
+    max_time: float = MAX_TIME,
+) -> None:
+    LIMIT.max_requests = max_requests
+    LIMIT.max_time = max_time
+    LIMIT.start()
+
+
+def exhausted() -> bool:
+    return LIMIT.exhausted()
+
+
+def stats() -> dict[str, int | float | bool]:
+    return LIMIT.stats()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+
+from src.defaults.download import DETAILS_SIZE, MEMO_SIZE
+
+
+class Memo:
+    """
+    Bounded LRU of computed values, with single-flight computation.
+
+    Threads asking for a key that is already being computed wait for that
+    computation instead of repeating it.
+    """
+
+    def __init__(self, size: int = MEMO_SIZE):
+        self.size = size
+        self.values = OrderedDict()
+        self.pending = {}
+        self.lock = Lock()
+        self.counters = dict.fromkeys(("hits", "misses", "merged"), 0)
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.counters)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+            self.counters = dict.fromkeys(self.counters, 0)
+
+    def peek(self, key: Hashable):
+        with self.lock:
+            return self.values.get(key)
+
+    def put(self, key: Hashable, value) -> None:
+        with self.lock:
+            self.values[key] = value
+            self.values.move_to_end(key)
+            while len(self.values) > self.size:
+                self.values.popitem(last=False)
+
+    def get(self, key: Hashable, function: Callable):
+        with self.lock:
+            if key in self.values:
+                self.counters["hits"] += 1
+                self.values.move_to_end(key)
+                return self.values[key]
+            future = self.pending.get(key)
+            owner = future is None
+            if owner:
+                self.counters["misses"] += 1
+                future = self.pending[key] = Future()
+            else:
+                self.counters["merged"] += 1
+        if not owner:
+            return future.result()
+        try:
+            value = function()
+        except BaseException as e:
+            with self.lock:
+                del self.pending[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            del self.pending[key]
+            self.values[key] = value
+            while len(self.values) > self.size:
+                self.values.popitem(last=False)
+        future.set_result(value)
+        return value
+
+
+PAGES = Memo()
+DETAILS = Memo(size=DETAILS_SIZE)
+# Raw bodies of the last pages fetched, kept along with their failures.
+BODIES = Memo()
+
+
+def clear() -> None:
+    PAGES.clear()
+    DETAILS.clear()
+    BODIES.clear()
+
+
+def stats() -> dict[str, int]:
+    return PAGES.stats()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+from urllib.parse import urlsplit
+
+from src.defaults.download import PARSE_QUEUE, PROCESSES, USER_AGENT
+from src.get import archive, data, memo
+
+
+def __run__(function: Callable, url: str, body: bytes, parser: str):
+    # In a parsing process: `function` reads the page through `table()`,
+    # which parses the given body instead of downloading it.
+    data.PARSERS[urlsplit(url).netloc] = parser
+    data.bodies[url] = body
+    try:
+        return function()
+    finally:
+        data.bodies.clear()
+        memo.clear()
+
+
+class Pipeline:
+    """
+    Process pool parsing the downloaded pages, outside of the GIL.
+
+    The threads downloading the pages hand them to `processes` processes,
+    which parse and extract them into plain records. At most `queue` pages
+    wait for (or are in) a parsing process, so the threads stop downloading
+    while the processes are behind.
+    """
+
+    def __init__(self, processes: int = PROCESSES, queue: int = PARSE_QUEUE):
+        self.processes = processes
+        self.queue = queue
+        self.slots = BoundedSemaphore(max(1, queue))
+        self.executor = None  # type: ProcessPoolExecutor | None
+        self.lock = Lock()
+        self.counters = {"pages": 0, "bytes": 0, "seconds": 0.0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 0
+
+    def __executor__(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                # Spawned, as forking while other threads hold locks (of
+                # the connections, the memo...) could leave them held.
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=get_context("spawn"),
+                )
+            return self.executor
+
+    def parse(
+        self,
+        function: Callable,
+        url: str,
+        user_agent: str = USER_AGENT,
+    ):
+        body = archive.fetch(url=url, user_agent=user_agent).body
+        parser = data.PARSERS.get(urlsplit(url).netloc, "html.parser")
+        with self.slots:
+            start = perf_counter()
+            result = (
+                self.__executor__()
+                .submit(__run__, function, url, body, parser)
+                .result()
+            )
+        with self.lock:
+            self.counters["pages"] += 1
+            self.counters["bytes"] += len(body)
+            self.counters["seconds"] += perf_counter() - start
+        return result
+
+    def stats(self) -> dict[str, int | float]:
+        with self.lock:
+            return dict(self.counters)
+
+    def close(self) -> None:
+        with self.lock:
+            executor, self.executor = self.executor, None
+            self.counters = dict.fromkeys(self.counters, 0)
+        if executor is not None:
+            executor.shutdown()
+
+
+PARSING = Pipeline()
+
+
+def configure(processes: int = PROCESSES, queue: int = PARSE_QUEUE) -> None:
+    if (processes, queue) != (PARSING.processes, PARSING.queue):
+        PARSING.close()
+        PARSING.processes = processes
+        PARSING.queue = queue
+        PARSING.slots = BoundedSemaphore(max(1, queue))
+
+
+def enabled() -> bool:
+    return PARSING.enabled
+
+
+def parse(function: Callable, url: str, user_agent: str = USER_AGENT):
+    return PARSING.parse(function=function, url=url, user_agent=user_agent)
+
+
+def stats() -> dict[str, int | float]:
+    return PARSING.stats()
+
+
+def close() -> None:
+    PARSING.close()
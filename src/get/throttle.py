@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Condition
+from time import monotonic, time
+
+from src.debug import logging
+from src.defaults import defaults
+from src.defaults.download import (
+    BACKOFF,
+    BACKOFF_MAX,
+    HOST_CONCURRENCY,
+    SLOW_RESPONSE,
+    THROTTLED,
+)
+
+
+def retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(
+    attempt: int,
+    base: float = BACKOFF,
+    ceiling: float = BACKOFF_MAX,
+) -> float:
+    # "Full jitter": a random wait up to the exponential backoff, so that
+    # threads throttled at the same time don't retry at the same time.
+    return uniform(0, min(ceiling, base * 2**attempt))
+
+
+class Throttle:
+    """
+    Concurrency limit of a host, adapted to its responses (AIMD).
+
+    The limit grows by one request for every `limit` healthy responses,
+    and is halved when the host throttles (429, 503) or answers slower
+    than `slow` seconds, at most once per round of requests in flight.
+    A `Retry-After` header pauses every request to the host until then.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        ceiling: int = HOST_CONCURRENCY,
+        slow: float = SLOW_RESPONSE,
+        debug: bool = defaults.DEBUG,
+    ):
+        self.host = host
+        self.ceiling = ceiling
+        self.slow = slow
+        self.debug = debug
+        self.limit = float(min(2, ceiling))
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.decreased = 0.0
+        self.condition = Condition()
+
+    def __log__(self, reason: str) -> None:
+        logging.logger(Throttle).debug(
+            f"{self.host}: {reason}, limit {self.limit:.2f}, "
+            + f"{self.in_flight} in flight"
+            + (
+                f", paused {self.paused_until - monotonic():.1f} s"
+                if self.paused_until > monotonic()
+                else ""
+            )
+            + "."
+        )
+
+    def acquire(self) -> float:
+        with self.condition:
+            while True:
+                wait = self.paused_until - monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self.condition.wait(wait if wait > 0 else None)
+            self.in_flight += 1
+        return monotonic()
+
+    def release(
+        self,
+        started: float,
+        status: int | None,
+        retry: float | None = None,
+    ) -> None:
+        now = monotonic()
+        with self.condition:
+            self.in_flight -= 1
+            if retry:
+                self.paused_until = max(self.paused_until, now + retry)
+            healthy = status not in THROTTLED and status is not None
+            if not healthy or now - started > self.slow:
+                # Responses of requests sent before the last decrease were
+                # already accounted for in it.
+                if started > self.decreased:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.decreased = now
+                    if self.debug:
+                        self.__log__(
+                            f"decreased after {status or 'an error'} in "
+                            + f"{now - started:.1f} s"
+                        )
+            elif self.limit < self.ceiling:
+                previous = int(self.limit)
+                self.limit = min(self.ceiling, self.limit + 1 / self.limit)
+                if self.debug and int(self.limit) > previous:
+                    self.__log__("increased")
+            self.condition.notify_all()
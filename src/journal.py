@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+from collections.abc import Hashable
+from pathlib import Path
+from threading import Lock
+
+from src.debug import logging
+from src.defaults import path
+
+
+class Journal:
+    """
+    Append-only record of the finished units of a download.
+
+    A unit is one call of the dump function (an AOTY type and page, or a
+    ProgArchives genre and type), stored with the albums it produced and
+    whether it reached the minimum score, so an interrupted download can
+    be resumed without fetching those units again. Only where every unit
+    is in the file is kept in memory, and its albums are read back from it
+    when resuming.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: dict,
+        resume: bool = False,
+        directory: Path = path.JOURNAL,
+    ):
+        logger = logging.logger(Journal)
+        self.file = directory / f"{name}.journal"
+        self.params = params
+        self.units = {}  # type: dict[Hashable, tuple[int, bool]]
+        self.lock = Lock()
+        if resume and self.file.exists():
+            header, end = self.__read__()
+            if header != params:
+                logger.warning(
+                    f"Journal {self.file.name} was written with {header}, "
+                    + f"not {params}. Starting the download over."
+                )
+                self.units.clear()
+            else:
+                # Units are appended after the last one read.
+                os.truncate(self.file, end)
+        elif resume:
+            logger.warning(f"No journal found in {self.file}.")
+        if not self.units:
+            with open(self.file, "wb") as f:
+                pickle.dump(params, f)
+
+    def __read__(self) -> tuple[dict | None, int]:
+        with open(self.file, "rb") as f:
+            header = pickle.load(f)
+            while True:
+                offset = f.tell()
+                try:
+                    key, _, last = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError, ValueError):
+                    break  # A unit interrupted while being written.
+                self.units[key] = (offset, last)
+        return header, offset
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.units
+
+    def __getitem__(self, key: Hashable) -> tuple[list[dict], bool]:
+        offset, _ = self.units[key]
+        with open(self.file, "rb") as f:
+            f.seek(offset)
+            _, albums, last = pickle.load(f)
+        return albums, last
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def record(self, key: Hashable, albums: list[dict], last: bool) -> None:
+        with self.lock:
+            with open(self.file, "ab") as f:
+                self.units[key] = (f.seek(0, os.SEEK_END), last)
+                pickle.dump((key, albums, last), f)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        self.file.unlink(missing_ok=True)
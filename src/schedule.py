@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+from src.debug import logging
+from src.defaults import path
+from src.defaults.download import (
+    MAX_AGE,
+    MIN_AGE,
+    VOLATILE,
+    VOLATILITY_WEIGHT,
+)
+
+DAY = 24 * 60 * 60
+
+
+class Schedule:
+    """
+    History of the albums of a list, to refresh the volatile ones first.
+
+    Every download records when each album was last seen in the list, with
+    its `user_score` and `user_ratings`, and keeps how much they change per
+    day as a moving average (its volatility). Albums without details come
+    first, then the volatile ones (after `min_age` days), and then the
+    stable ones (after `max_age` days), up to the budget of the download.
+    """
+
+    def __init__(self, name: str, directory: Path = path.SCHEDULE):
+        self.file = directory / f"{name}.schedule"
+        self.albums = {}  # type: dict[int, dict]
+        if self.file.exists():
+            try:
+                with open(self.file, "rb") as f:
+                    self.albums = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError) as e:
+                logging.logger(Schedule).warning(
+                    f"Schedule {self.file.name} can't be read ({e!r}), "
+                    + "starting it over."
+                )
+
+    def observe(
+        self,
+        albums: list[dict],
+        now: datetime | None = None,
+        weight: float = VOLATILITY_WEIGHT,
+    ) -> None:
+        now = now or datetime.now()
+        for a in albums:
+            score, ratings = a.get("user_score"), a.get("user_ratings")
+            if score is None:
+                continue
+            old = self.albums.get(a["internal_id"])
+            if old is None:
+                # Without history, albums of this year and the last one are
+                # expected to change.
+                year = a.get("year")
+                volatility = (
+                    VOLATILE if year and year >= now.year - 1 else 0.0
+                )
+            else:
+                days = max(1.0, (now - old["seen"]).total_seconds() / DAY)
+                change = abs(score - old["score"]) + (
+                    100 * abs((ratings or 0) - (old["ratings"] or 0))
+                    / max(1, old["ratings"] or 0)
+                )
+                volatility = (
+                    weight * change / days
+                    + (1 - weight) * old["volatility"]
+                )
+            self.albums[a["internal_id"]] = {
+                "seen": now,
+                "score": score,
+                "ratings": ratings,
+                "volatility": volatility,
+            }
+
+    def volatility(self, internal_id: int) -> float:
+        return self.albums.get(internal_id, {}).get("volatility", 0.0)
+
+    def plan(
+        self,
+        albums: list[dict],
+        budget: int,
+        max_age: int = MAX_AGE,
+        min_age: int = MIN_AGE,
+        volatile: float = VOLATILE,
+        now: datetime | None = None,
+    ) -> list[int]:
+        now = now or datetime.now()
+        missing, changing, stale = [], [], []
+        for internal_id, a in {a["internal_id"]: a for a in albums}.items():
+            fetched = a.get("detail_date")
+            if not fetched:
+                missing.append(internal_id)
+                continue
+            age = (now - fetched).total_seconds() / DAY
+            volatility = self.volatility(internal_id)
+            if volatility >= volatile and age >= min_age:
+                changing.append((volatility * age, internal_id))
+            elif age >= max_age:
+                stale.append((age, internal_id))
+        return (
+            missing
+            + [i for _, i in sorted(changing, reverse=True)]
+            + [i for _, i in sorted(stale, reverse=True)]
+        )[:budget]
+
+    def save(self) -> None:
+        tmp = self.file.with_name(f"{self.file.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(self.albums, f)
+        os.replace(tmp, self.file)
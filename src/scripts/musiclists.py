@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from datetime import date
 from pathlib import Path
 
 import src.decorators.commands as de
@@ -12,15 +13,42 @@ from src.defaults.choice import (
     ALBUM_SORT_BY,
     TRACK_SORT_BY,
 )
-from src.defaults.download import AOTY_TYPES, PROG_TYPES
+from src.defaults.download import (
+    AOTY_FIELDS,
+    AOTY_FIRST_YEAR,
+    AOTY_TYPES,
+    PROG_FIELDS,
+    PROG_TYPES,
+)
 from src.files import from_dir, to_playlist
 
 
 @de.download_aoty
 def download_aoty(
     types: tuple,
+    by_year: bool,
     min_score: int,
     max_score: int,
+    concurrency: int,
+    workers: int,
+    processes: int,
+    cache: bool,
+    refresh: bool,
+    parser: str,
+    archive: bool,
+    resume: bool,
+    frontier: bool,
+    incremental: bool,
+    max_age: int,
+    budget: int,
+    max_requests: int,
+    max_time: int,
+    dry_run: bool,
+    tracks: bool,
+    fields: tuple,
+    batch_size: int,
+    base_url: str,
+    serve: str | None,
     quiet: bool,
     verbose: bool,
     debug: bool,
@@ -37,6 +65,34 @@ def download_aoty(
         min_score=min_score,
         max_score=max_score,
         types=AOTY_TYPES if "all" in types else types,
+        years=(
+            tuple(range(AOTY_FIRST_YEAR, date.today().year + 1))
+            if by_year
+            else None
+        ),
+        concurrency=concurrency,
+        workers=workers,
+        processes=processes,
+        cache=cache,
+        refresh=refresh,
+        parser=parser,
+        archive=archive,
+        resume=resume,
+        frontier=frontier,
+        incremental=incremental,
+        max_age=max_age,
+        budget=budget,
+        max_requests=max_requests,
+        max_time=max_time,
+        dry_run=dry_run,
+        fields=tuple(
+            f
+            for f in (AOTY_FIELDS if "all" in fields else fields)
+            if tracks or f != "tracks"
+        ),
+        batch_size=batch_size,
+        base_url=base_url,
+        serve=serve,
         quiet=quiet,
         verbose=verbose,
         debug=debug,
@@ -49,6 +105,26 @@ def download_prog(
     min_score: int,
     max_score: int,
     ceil: bool,
+    concurrency: int,
+    workers: int,
+    processes: int,
+    cache: bool,
+    refresh: bool,
+    parser: str,
+    archive: bool,
+    resume: bool,
+    frontier: bool,
+    incremental: bool,
+    max_age: int,
+    budget: int,
+    max_requests: int,
+    max_time: int,
+    dry_run: bool,
+    tracks: bool,
+    fields: tuple,
+    batch_size: int,
+    base_url: str,
+    serve: str | None,
     quiet: bool,
     verbose: bool,
     debug: bool,
@@ -72,6 +148,153 @@ def download_prog(
         max_score=max_score,
         types=tuple(PROG_TYPES.keys()) if "all" in types else types,
         ceil=ceil,
+        concurrency=concurrency,
+        workers=workers,
+        processes=processes,
+        cache=cache,
+        refresh=refresh,
+        parser=parser,
+        archive=archive,
+        resume=resume,
+        frontier=frontier,
+        incremental=incremental,
+        max_age=max_age,
+        budget=budget,
+        max_requests=max_requests,
+        max_time=max_time,
+        dry_run=dry_run,
+        fields=tuple(
+            f
+            for f in (PROG_FIELDS if "all" in fields else fields)
+            if tracks or f != "tracks"
+        ),
+        batch_size=batch_size,
+        base_url=base_url,
+        serve=serve,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+
+
+@de.download_enrich
+def download_enrich(
+    data: str,
+    fields: tuple,
+    concurrency: int,
+    cache: bool,
+    refresh: bool,
+    base_url: str | None,
+    quiet: bool,
+    verbose: bool,
+    debug: bool,
+):
+    """
+    Fill in the album pages data of a downloaded list.
+
+    This function downloads the parts of the album pages given in `fields`
+    (by default, the tracklists) for the albums of `data` that lack them,
+    such as a list downloaded with `--no-tracks` or a filtered subset of it,
+    and saves the list again along with its tracks. Album pages failing are
+    kept for `retry-failed`, and the list is saved with the rest.
+    """
+    download.enrich(
+        data=data,
+        fields=fields,
+        concurrency=concurrency,
+        cache=cache,
+        refresh=refresh,
+        base_url=base_url,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+
+
+@de.download_retry_failed
+def download_retry_failed(
+    data: str,
+    concurrency: int,
+    cache: bool,
+    refresh: bool,
+    quiet: bool,
+    verbose: bool,
+    debug: bool,
+):
+    """
+    Retry the pages and albums that failed while downloading a list.
+
+    This function downloads again the entries of the dead-letter store of
+    `data` (list pages or album pages that raised an error, or albums
+    without a score), and merges the recovered albums into the list.
+    Entries failing again are kept for a later retry.
+    """
+    download.retry_failed(
+        data=data,
+        concurrency=concurrency,
+        cache=cache,
+        refresh=refresh,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+
+
+@de.download_worker
+def download_worker(
+    coordinator: str,
+    concurrency: int,
+    workers: int,
+    processes: int,
+    cache: bool,
+    refresh: bool,
+    quiet: bool,
+    verbose: bool,
+    debug: bool,
+):
+    """
+    Download the lists handed out by a coordinator.
+
+    This function claims the list pages of the download started with
+    `--serve` at `COORDINATOR` (as http://HOST:PORT), downloads their
+    albums and sends them back, until the download is done.
+    """
+    download.worker(
+        coordinator=coordinator,
+        concurrency=concurrency,
+        workers=workers,
+        processes=processes,
+        cache=cache,
+        refresh=refresh,
+        quiet=quiet,
+        verbose=verbose,
+        debug=debug,
+    )
+
+
+@de.download_reparse
+def download_reparse(
+    data: str,
+    concurrency: int,
+    workers: int,
+    processes: int,
+    quiet: bool,
+    verbose: bool,
+    debug: bool,
+):
+    """
+    Rebuild a downloaded list from its archived pages, without the network.
+
+    This function extracts again the albums and tracks of `data` from the
+    pages kept while downloading it with `--archive`, with the same types
+    and scores, so that new or fixed attributes are filled in without
+    crawling the website again.
+    """
+    download.reparse(
+        data=data,
+        concurrency=concurrency,
+        workers=workers,
+        processes=processes,
         quiet=quiet,
         verbose=verbose,
         debug=debug,